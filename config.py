@@ -25,7 +25,8 @@ class Config:
 
     # ==================== File Processing ====================
     PDF_UPLOAD_TIMEOUT_SECONDS = 60
-    MAX_PDF_UPLOAD_ATTEMPTS = 60
+    PDF_POLL_INITIAL_DELAY = 0.1  # Seconds; doubled after each processing check
+    PDF_POLL_MAX_DELAY = 2.0
     MAX_PDF_SIZE_MB = 10
 
     # ==================== Display Settings ====================
@@ -36,9 +37,11 @@ class Config:
     # ==================== Matching Configuration ====================
     # Rough matching settings
     ROUGH_MATCH_TOP_K = 50
+    ROUGH_MATCH_TOP_CHUNKS = 5  # Top matching chunks kept per resume
 
     # Precise matching settings
     PRECISE_MATCH_TOP_N = 10
+    MATCH_BATCH_SIZE = 5  # Resumes evaluated per LLM call (1 = one call per resume)
 
     # Hybrid matching settings
     HYBRID_ROUGH_TOP_K = 50
@@ -61,12 +64,26 @@ class Config:
     ENABLE_CACHE = True
     CACHE_MAX_AGE_DAYS = 30
 
+    # Match result cache (keyed by resume and JD content hashes)
+    MATCH_CACHE_DIR = "./cache/match_results"
+    MATCH_CACHE_MAX_SIZE = 1000  # Entries kept in the cache's in-memory tier
+    MATCH_CACHE_TTL_SECONDS = 3600
+
+    # In-memory JD parse cache (keyed by JD text hash)
+    JD_PARSE_CACHE_MAX_SIZE = 512
+
+    # In-memory cache of merged resume/JD text in the matcher
+    MERGE_CACHE_MAX_SIZE = 512
+
     # ==================== Logging ====================
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
     # ==================== Batch Processing ====================
     BATCH_PROGRESS_UPDATE_INTERVAL = 1  # Update progress every N files
+    LLM_CONCURRENCY = 8  # Maximum concurrent LLM requests in async batch processing
+    LLM_MAX_RETRIES = 3  # Retries on Gemini quota errors in async batch processing
+    LLM_RETRY_BASE_DELAY = 10  # Seconds; doubled after each quota error
 
     # ==================== Text Processing ====================
     MAX_CHUNK_SIZE = 512  # Maximum characters per chunk
@@ -52,6 +52,10 @@ class ChromaDBStorage:
             )
             logger.debug("Chunks collection initialized")
 
+            # Distance metric determines how similarity maps to a match score
+            self.distance_metric = self._detect_distance_metric(self.chunks_collection)
+            logger.debug(f"Chunks collection distance metric: {self.distance_metric}")
+
             # Create PDF storage directory
             from config import Config
             self.pdf_storage_dir = Config.PDF_STORAGE_DIR
@@ -67,6 +71,24 @@ class ChromaDBStorage:
                 details={'persist_directory': persist_directory}
             )
     
+    @staticmethod
+    def _detect_distance_metric(collection) -> str:
+        """
+        Detect the HNSW distance metric of a collection
+
+        Args:
+            collection: ChromaDB collection
+
+        Returns:
+            Metric name ('l2', 'cosine' or 'ip'); ChromaDB defaults to 'l2'
+        """
+        space = (collection.metadata or {}).get("hnsw:space")
+        if not space:
+            configuration = getattr(collection, "configuration", None)
+            if isinstance(configuration, dict):
+                space = (configuration.get("hnsw") or {}).get("space")
+        return space or "l2"
+
     @log_execution_time(logger)
     def store_document(
         self,
@@ -357,6 +379,49 @@ class ChromaDBStorage:
             logger.error(f"Failed to retrieve chunks for {document_id}: {str(e)}", exc_info=True)
             return []
     
+    def get_chunks_by_documents(self, document_ids: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Retrieve all chunks for several documents in a single query
+
+        Args:
+            document_ids: Document identifiers
+
+        Returns:
+            Dictionary mapping each document ID to its list of chunk dictionaries
+            (documents without chunks are omitted), in the order of document_ids
+        """
+        if not document_ids:
+            return {}
+
+        try:
+            logger.debug(f"Fetching chunks for {len(document_ids)} documents")
+
+            results = self.chunks_collection.get(
+                where={"document_id": {"$in": list(document_ids)}},
+                include=["documents", "metadatas"]
+            )
+
+            grouped = {document_id: [] for document_id in document_ids}
+            for chunk_id, content, metadata in zip(
+                results['ids'], results['documents'], results['metadatas']
+            ):
+                chunks = grouped.get(metadata.get('document_id'))
+                if chunks is not None:
+                    chunks.append({
+                        "chunk_id": chunk_id,
+                        "content": content,
+                        "metadata": metadata
+                    })
+
+            grouped = {document_id: chunks for document_id, chunks in grouped.items() if chunks}
+
+            logger.info(f"Retrieved {len(results['ids'])} chunks for {len(grouped)} documents")
+            return grouped
+
+        except Exception as e:
+            logger.error(f"Failed to retrieve chunks for {len(document_ids)} documents: {str(e)}", exc_info=True)
+            return {}
+
     def delete_document(self, document_id: str):
         """
         Delete a document and all its associated chunks
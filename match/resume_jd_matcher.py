@@ -6,7 +6,10 @@ Merges resume chunks and compares with JD to determine qualification
 import json
 from typing import Dict, List, Any, Optional
 from functools import lru_cache
+from itertools import chain
+from collections import OrderedDict, defaultdict
 import hashlib
+import heapq
 import sys
 import os
 
@@ -14,25 +17,85 @@ parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(parent_dir)
 
 from config import Config
-from prompt.match_resume_jd import generate_match_prompt
-import google.generativeai as genai
+from prompt.match_resume_jd import generate_match_prompt, generate_batch_match_prompt
+import numpy as np
+from utils.llm_client import get_generative_model
 from utils.logger import get_logger, log_execution_time
-from utils.text_utils import extract_json_from_text, truncate_text
+from utils.cache_manager import create_text_cache
+from utils.text_utils import extract_json_from_text, parse_json, truncate_text
 from utils.exceptions import MissingAPIKeyError, LLMError
 
 # Initialize logger
 logger = get_logger(__name__)
 
 
+# Section order used when merging resume chunks (for better readability)
+_RESUME_FIELD_ORDER = (
+    'summary',
+    'experience',
+    'skills',
+    'education',
+    'certifications',
+    'projects',
+    'achievements'
+)
+_RESUME_FIELD_SET = frozenset(_RESUME_FIELD_ORDER)
+
+
+def _group_contents_by_field(chunks: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+    """Group chunk contents by their metadata field, preserving first-seen order"""
+    field_groups = defaultdict(list)
+    for chunk in chunks:
+        field_groups[chunk.get('metadata', {}).get('field', 'unknown')].append(chunk.get('content', ''))
+    return field_groups
+
+
+def _format_section(field: str, contents: List[str]) -> str:
+    """Format a merged section with its field header"""
+    return f"## {field.upper()}\n" + '\n'.join(contents)
+
+
+def _match_score_key(result: Dict[str, Any]) -> float:
+    """Sort key for match results"""
+    return result.get('match_score', 0)
+
+
+def _extract_json_array(text: str) -> Optional[str]:
+    """Extract the outermost JSON array from an LLM response"""
+    start = text.find('[')
+    end = text.rfind(']')
+    return text[start:end + 1] if start != -1 and end > start else None
+
+
+def _legacy_similarity_to_score(avgs: np.ndarray) -> np.ndarray:
+    """Map similarities in [0, 1] directly to a percentage, others via (avg + 1) * 50"""
+    in_unit_range = (avgs >= 0) & (avgs <= 1)
+    return np.where(in_unit_range, avgs * 100, np.clip((avgs + 1) * 50, 0, 100))
+
+
+# Vectorized similarity → 0-100 score mappings by ChromaDB distance metric.
+# The storage layer reports similarity = 1 - distance, so:
+# - cosine: distance = 1 - cos, similarity is the cosine similarity
+# - ip: distance = 1 - dot, similarity is the dot product
+# - l2: distance is squared L2, which for normalized embeddings equals
+#   2 * (1 - cos), so cos = (similarity + 1) / 2
+_SCORE_FUNCTIONS = {
+    'cosine': lambda avgs: np.clip(avgs * 100, 0, 100),
+    'ip': lambda avgs: np.clip(avgs * 100, 0, 100),
+    'l2': lambda avgs: np.clip((avgs + 1) * 50, 0, 100),
+}
+
+
 class ResumeJDMatcher:
     """Matches resumes with job descriptions and provides qualification analysis"""
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, enable_cache: bool = True):
         """
         Initialize the matcher with LLM client
 
         Args:
             api_key: Google API key (optional, will use config if not provided)
+            enable_cache: Whether to cache LLM match results
 
         Raises:
             MissingAPIKeyError: If API key is not found
@@ -47,12 +110,22 @@ class ResumeJDMatcher:
                     "Google API key not found. Please set GOOGLE_API_KEY in .env file"
                 )
 
-            genai.configure(api_key=api_key)
-            self.llm_client = genai.GenerativeModel(Config.MATCHING_LLM_MODEL)
+            self.llm_client = get_generative_model(api_key, Config.MATCHING_LLM_MODEL)
             logger.debug(f"LLM client initialized with {Config.MATCHING_LLM_MODEL}")
 
             # Initialize cache for merged content
-            self._merge_cache = {}
+            self._merge_cache = OrderedDict()
+
+            # Disk cache for match results; its in-memory LRU tier serves repeats
+            self.enable_cache = enable_cache
+            if self.enable_cache:
+                self.match_cache = create_text_cache(
+                    cache_dir=Config.MATCH_CACHE_DIR,
+                    mem_cap=Config.MATCH_CACHE_MAX_SIZE
+                )
+                logger.info("Match result caching enabled")
+            else:
+                logger.info("Match result caching disabled")
 
             logger.info("ResumeJDMatcher initialization completed")
 
@@ -70,9 +143,31 @@ class ResumeJDMatcher:
         Returns:
             Hash string
         """
-        # Create a deterministic string representation
-        chunk_str = json.dumps(chunks, sort_keys=True)
-        return hashlib.md5(chunk_str.encode()).hexdigest()
+        # Hash chunk IDs, fields and contents in order: merge output depends
+        # on the order and on each chunk's field (section grouping)
+        digest = hashlib.blake2b(digest_size=16)
+        for chunk in chunks:
+            digest.update(chunk.get('chunk_id', '').encode())
+            digest.update(b'\x00')
+            digest.update(chunk.get('metadata', {}).get('field', 'unknown').encode())
+            digest.update(b'\x00')
+            digest.update(chunk.get('content', '').encode())
+            digest.update(b'\x00')
+        return digest.hexdigest()
+
+    def _get_cached_merge(self, cache_key: str) -> Optional[str]:
+        """Look up merged content in the in-memory LRU"""
+        merged_content = self._merge_cache.get(cache_key)
+        if merged_content is not None:
+            self._merge_cache.move_to_end(cache_key)
+        return merged_content
+
+    def _remember_merge(self, cache_key: str, merged_content: str):
+        """Cache merged content, evicting the oldest entries beyond the size limit"""
+        self._merge_cache[cache_key] = merged_content
+        self._merge_cache.move_to_end(cache_key)
+        while len(self._merge_cache) > Config.MERGE_CACHE_MAX_SIZE:
+            self._merge_cache.popitem(last=False)
 
     def merge_resume_chunks(self, chunks: List[Dict[str, Any]], resume_id: str = None) -> str:
         """
@@ -80,7 +175,7 @@ class ResumeJDMatcher:
 
         Args:
             chunks: List of chunk dictionaries with 'field' and 'content'
-            resume_id: Optional resume ID for cache key (more readable)
+            resume_id: Optional resume ID, used as a readable cache key prefix
 
         Returns:
             Merged resume content as a single string
@@ -88,59 +183,36 @@ class ResumeJDMatcher:
         if not chunks:
             return ""
 
-        # Check cache first
-        cache_key = resume_id if resume_id else self._generate_chunks_hash(chunks)
-        if cache_key in self._merge_cache:
+        # Check cache first. IDs are reused after re-indexing, so the content
+        # hash is always part of the key
+        chunks_hash = self._generate_chunks_hash(chunks)
+        cache_key = f"{resume_id}:{chunks_hash}" if resume_id else chunks_hash
+        merged_content = self._get_cached_merge(cache_key)
+        if merged_content is not None:
             logger.debug(f"Cache hit for resume merge: {cache_key}")
-            return self._merge_cache[cache_key]
+            return merged_content
 
         # Group chunks by field
-        field_groups = {}
-        for chunk in chunks:
-            field = chunk.get('metadata', {}).get('field', 'unknown')
-            content = chunk.get('content', '')
-
-            if field not in field_groups:
-                field_groups[field] = []
-            field_groups[field].append(content)
-
-        # Merge chunks with field headers
-        merged_sections = []
-
-        # Define field order for better readability
-        field_order = [
-            'summary',
-            'experience',
-            'skills',
-            'education',
-            'certifications',
-            'projects',
-            'achievements'
-        ]
-
-        # Add fields in preferred order
-        for field in field_order:
-            if field in field_groups:
-                section_content = '\n'.join(field_groups[field])
-                merged_sections.append(f"## {field.upper()}\n{section_content}")
-
-        # Add any remaining fields not in the order
-        for field, contents in field_groups.items():
-            if field not in field_order:
-                section_content = '\n'.join(contents)
-                merged_sections.append(f"## {field.upper()}\n{section_content}")
-
-        merged_content = '\n\n'.join(merged_sections)
+        field_groups = _group_contents_by_field(chunks)
+
+        # Add fields in preferred order, then any remaining fields not in the order
+        merged_content = '\n\n'.join(
+            _format_section(field, field_groups[field])
+            for field in chain(
+                (field for field in _RESUME_FIELD_ORDER if field in field_groups),
+                (field for field in field_groups if field not in _RESUME_FIELD_SET)
+            )
+        )
 
         # Cache the result
-        self._merge_cache[cache_key] = merged_content
+        self._remember_merge(cache_key, merged_content)
         logger.debug(f"Cached resume merge: {cache_key}")
 
         return merged_content
 
     def merge_jd_chunks(self, chunks: List[Dict[str, Any]]) -> str:
         """
-        Merge all chunks of a job description into a single text
+        Merge all chunks of a job description into a single text (with caching)
 
         Args:
             chunks: List of JD chunk dictionaries
@@ -151,28 +223,75 @@ class ResumeJDMatcher:
         if not chunks:
             return ""
 
-        # Group chunks by field
-        field_groups = {}
-        for chunk in chunks:
-            field = chunk.get('metadata', {}).get('field', 'unknown')
-            content = chunk.get('content', '')
+        # Check cache first
+        cache_key = f"jd:{self._generate_chunks_hash(chunks)}"
+        merged_content = self._get_cached_merge(cache_key)
+        if merged_content is not None:
+            logger.debug(f"Cache hit for JD merge: {cache_key}")
+            return merged_content
+
+        # Group chunks by field and merge with field headers
+        field_groups = _group_contents_by_field(chunks)
+        merged_content = '\n\n'.join(
+            _format_section(field, contents)
+            for field, contents in field_groups.items()
+        )
 
-            if field not in field_groups:
-                field_groups[field] = []
-            field_groups[field].append(content)
+        # Cache the result
+        self._remember_merge(cache_key, merged_content)
+        logger.debug(f"Cached JD merge: {cache_key}")
 
-        # Merge chunks with field headers
-        merged_sections = []
-        for field, contents in field_groups.items():
-            section_content = '\n'.join(contents)
-            merged_sections.append(f"## {field.upper()}\n{section_content}")
+        return merged_content
+
+    def _generate_match_cache_key(self, resume_id: Optional[str], resume_content: str, jd_content: str) -> str:
+        """
+        Generate the match result cache key from resume and JD content
+
+        Resume IDs are derived from candidate names and reused after a
+        delete or re-upload, so the resume content is always hashed in.
+
+        Args:
+            resume_id: Optional resume ID, kept as a readable prefix
+            resume_content: Merged resume content
+            jd_content: Merged JD content
+
+        Returns:
+            Cache key string of the form "[<resume_id>:]<resume_hash>:<jd_hash>"
+        """
+        resume_hash = hashlib.blake2b(resume_content.encode(), digest_size=16).hexdigest()
+        jd_hash = hashlib.blake2b(jd_content.encode(), digest_size=16).hexdigest()
+        content_key = f"{resume_hash}:{jd_hash}"
+        return f"{resume_id}:{content_key}" if resume_id else content_key
+
+    def _get_cached_match(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a match result in the match cache
+
+        Args:
+            cache_key: Key from _generate_match_cache_key
+
+        Returns:
+            Cached match result (a fresh copy), or None on miss/expiry
+        """
+        if not self.enable_cache:
+            return None
+
+        return self.match_cache.get(
+            cache_key,
+            max_age_days=Config.MATCH_CACHE_TTL_SECONDS / 86400
+        )
 
-        return '\n\n'.join(merged_sections)
+    def _store_match(self, cache_key: str, result: Dict[str, Any]):
+        """Store a successful match result in the match cache"""
+        if self.enable_cache:
+            self.match_cache.set(cache_key, result)
 
     def clear_cache(self):
-        """Clear the merge cache"""
+        """Clear the merge cache and the match result cache"""
         self._merge_cache.clear()
-        logger.info("Merge cache cleared")
+        if self.enable_cache:
+            self.match_cache.clear_all()
+        logger.info("Merge and match caches cleared")
 
     def get_cache_stats(self) -> Dict[str, int]:
         """Get cache statistics"""
@@ -185,14 +304,19 @@ class ResumeJDMatcher:
     def match_resume_with_jd(
         self,
         resume_chunks: List[Dict[str, Any]],
-        jd_chunks: List[Dict[str, Any]]
+        jd_chunks: List[Dict[str, Any]],
+        resume_id: str = None
     ) -> Dict[str, Any]:
         """
         Match a resume with a job description and get qualification result
 
+        Results are cached by resume and JD content hash, so re-running the
+        same JD against an unchanged resume skips the LLM call.
+
         Args:
             resume_chunks: List of resume chunk dictionaries
             jd_chunks: List of JD chunk dictionaries
+            resume_id: Optional resume ID, used as a readable cache key prefix
 
         Returns:
             Dictionary containing match results with qualification decision
@@ -213,6 +337,13 @@ class ResumeJDMatcher:
                     "error": "Insufficient data for matching"
                 }
 
+            # Check match result cache before calling the LLM
+            cache_key = self._generate_match_cache_key(resume_id, resume_content, jd_content)
+            cached_result = self._get_cached_match(cache_key)
+            if cached_result is not None:
+                logger.info(f"Using cached match result (cache hit): score={cached_result.get('match_score', 0)}")
+                return cached_result
+
             # Generate prompt
             prompt = generate_match_prompt(resume_content, jd_content)
 
@@ -232,8 +363,9 @@ class ResumeJDMatcher:
             try:
                 json_str = extract_json_from_text(response_text)
                 if json_str:
-                    result = json.loads(json_str)
+                    result = parse_json(json_str)
                     logger.info(f"Match completed: score={result.get('match_score', 0)}")
+                    self._store_match(cache_key, result)
                     return result
                 else:
                     logger.error("No JSON found in LLM response")
@@ -279,18 +411,118 @@ class ResumeJDMatcher:
         Returns:
             List of match results for each resume
         """
-        results = []
+        results = self._precise_match_many(resume_chunks_list, jd_chunks)
 
-        for resume_id, resume_chunks in resume_chunks_list:
-            match_result = self.match_resume_with_jd(resume_chunks, jd_chunks)
+        for (resume_id, _), match_result in zip(resume_chunks_list, results):
             match_result['resume_id'] = resume_id
-            results.append(match_result)
 
         # Sort by match_score descending
         results.sort(key=lambda x: x.get('match_score', 0), reverse=True)
 
         return results
 
+    def _precise_match_many(
+        self,
+        resume_chunks_list: List[tuple],
+        jd_chunks: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Precisely match several resumes with one JD, several resumes per LLM call
+
+        Cached results are reused; uncached resumes are evaluated in groups of
+        Config.MATCH_BATCH_SIZE with a single batch prompt. Any resume the batch
+        response does not cover falls back to match_resume_with_jd.
+
+        Args:
+            resume_chunks_list: List of tuples (resume_id, resume_chunks)
+            jd_chunks: List of JD chunk dictionaries
+
+        Returns:
+            Match results in the same order as resume_chunks_list
+        """
+        batch_size = Config.MATCH_BATCH_SIZE
+        if batch_size <= 1:
+            return [
+                self.match_resume_with_jd(resume_chunks, jd_chunks, resume_id)
+                for resume_id, resume_chunks in resume_chunks_list
+            ]
+
+        jd_content = self.merge_jd_chunks(jd_chunks)
+        results = [None] * len(resume_chunks_list)
+        pending = []
+
+        for index, (resume_id, resume_chunks) in enumerate(resume_chunks_list):
+            resume_content = self.merge_resume_chunks(resume_chunks)
+            if not resume_content or not jd_content:
+                continue
+
+            cache_key = self._generate_match_cache_key(resume_id, resume_content, jd_content)
+            cached_result = self._get_cached_match(cache_key)
+            if cached_result is not None:
+                results[index] = cached_result
+            else:
+                pending.append((index, cache_key, resume_content))
+
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            if len(batch) < 2:
+                continue
+
+            evaluations = self._call_batch_match(jd_content, [content for _, _, content in batch])
+            for number, (index, cache_key, _) in enumerate(batch, start=1):
+                result = evaluations.get(number)
+                if result is not None:
+                    self._store_match(cache_key, result)
+                    results[index] = result
+
+        # Missing content, single leftovers and anything the batch call missed
+        for index, (resume_id, resume_chunks) in enumerate(resume_chunks_list):
+            if results[index] is None:
+                results[index] = self.match_resume_with_jd(resume_chunks, jd_chunks, resume_id)
+
+        return results
+
+    def _call_batch_match(self, jd_content: str, resume_contents: List[str]) -> Dict[int, Dict[str, Any]]:
+        """
+        Evaluate several resumes against a JD in one LLM call
+
+        Args:
+            jd_content: Merged JD content
+            resume_contents: Merged content of each resume
+
+        Returns:
+            Match results keyed by candidate number (1-based); empty on failure
+        """
+        logger.info(f"Batch matching {len(resume_contents)} resumes in one LLM call")
+        prompt = generate_batch_match_prompt(resume_contents, jd_content)
+
+        try:
+            response = self.llm_client.generate_content(prompt)
+            response_text = response.text.strip()
+            logger.debug(f"Received batch match response ({len(response_text)} chars)")
+
+            json_str = _extract_json_array(response_text)
+            evaluations = parse_json(json_str) if json_str else None
+            if not isinstance(evaluations, list):
+                logger.warning("No JSON array found in batch match response")
+                return {}
+
+        except Exception as e:
+            # Individual calls will retry these resumes
+            logger.warning(f"Batch match failed, falling back to single matches: {str(e)}")
+            return {}
+
+        results = {}
+        for position, evaluation in enumerate(evaluations, start=1):
+            if not isinstance(evaluation, dict):
+                continue
+            number = evaluation.pop('candidate', position)
+            if isinstance(number, int) and 1 <= number <= len(resume_contents):
+                results.setdefault(number, evaluation)
+
+        logger.info(f"Batch match completed: {len(results)}/{len(resume_contents)} evaluations")
+        return results
+
     @log_execution_time(logger)
     def rough_match_resumes(
         self,
@@ -323,53 +555,61 @@ class ResumeJDMatcher:
 
         logger.debug(f"Retrieved {len(search_results)} chunk results")
 
-        # Aggregate scores by resume_id
-        resume_scores = {}
-        resume_chunk_counts = {}
+        # Map resume_ids to dense integer indices in a single pass, keeping the
+        # (Python-level) top matching chunk collection alongside
+        resume_index = {}
         resume_top_chunks = {}
+        chunk_indices = []
+        similarities = []
+
+        top_chunks_limit = Config.ROUGH_MATCH_TOP_CHUNKS
 
-        for result in search_results:
+        for position, result in enumerate(search_results):
             resume_id = result['metadata'].get('document_id')
-            similarity = result.get('similarity', 0)
+            if not resume_id:
+                continue
 
-            if resume_id:
-                # Accumulate scores
-                if resume_id not in resume_scores:
-                    resume_scores[resume_id] = 0
-                    resume_chunk_counts[resume_id] = 0
-                    resume_top_chunks[resume_id] = []
-
-                resume_scores[resume_id] += similarity
-                resume_chunk_counts[resume_id] += 1
-
-                # Keep track of top matching chunks for this resume
-                resume_top_chunks[resume_id].append({
-                    'chunk_id': result['chunk_id'],
-                    'field': result['metadata'].get('field', 'unknown'),
-                    'content': truncate_text(result['content'], Config.CHUNK_PREVIEW_LENGTH),
-                    'similarity': similarity
-                })
-
-        # Calculate average scores and create results
-        results = []
-        for resume_id, total_score in resume_scores.items():
-            chunk_count = resume_chunk_counts[resume_id]
-            avg_score = total_score / chunk_count if chunk_count > 0 else 0
-
-            # Convert similarity to 0-100 scale
-            # ChromaDB cosine similarity is typically in [0, 1] range
-            # Apply non-linear scaling to better differentiate candidates
-            if avg_score >= 0 and avg_score <= 1:
-                # Direct percentage conversion with slight boosting for high scores
-                # This makes scores above 0.8 more competitive
-                if avg_score >= 0.8:
-                    match_score = 80 + (avg_score - 0.8) * 100  # 0.8-1.0 → 80-100
-                else:
-                    match_score = avg_score * 100  # 0-0.8 → 0-80
+            similarity = result.get('similarity', 0)
+            index = resume_index.get(resume_id)
+            if index is None:
+                index = resume_index[resume_id] = len(resume_index)
+                resume_top_chunks[resume_id] = []
+
+            chunk_indices.append(index)
+            similarities.append(similarity)
+
+            # Keep the top matching chunks for this resume in a bounded min-heap;
+            # on equal similarity the earlier result wins
+            top_chunks = resume_top_chunks[resume_id]
+            entry = (similarity, -position, result)
+            if len(top_chunks) < top_chunks_limit:
+                heapq.heappush(top_chunks, entry)
             else:
-                # Fallback for other similarity metrics (e.g., dot product)
-                match_score = max(0, min(100, (avg_score + 1) * 50))
-
+                heapq.heappushpop(top_chunks, entry)
+
+        # Pick the score mapping once for the whole result set
+        metric = getattr(db_storage, 'distance_metric', None)
+        score_fn = _SCORE_FUNCTIONS.get(metric, _legacy_similarity_to_score)
+
+        # Aggregate scores by resume_id with vectorized bincount
+        resume_count = len(resume_index)
+        if resume_count:
+            chunk_indices = np.asarray(chunk_indices, dtype=np.intp)
+            similarities = np.asarray(similarities, dtype=np.float64)
+            totals = np.bincount(chunk_indices, weights=similarities, minlength=resume_count)
+            counts = np.bincount(chunk_indices, minlength=resume_count)
+            avgs = totals / counts
+
+            # Convert similarity to 0-100 scale based on the collection's metric
+            scores = score_fn(avgs)
+        else:
+            totals = counts = avgs = scores = np.empty(0)
+
+        # Create results
+        results = []
+        for resume_id, total_score, chunk_count, avg_score, match_score in zip(
+            resume_index, totals.tolist(), counts.tolist(), avgs.tolist(), scores.tolist()
+        ):
             match_score = round(match_score, 2)
 
             # Determine qualification based on score
@@ -394,7 +634,15 @@ class ResumeJDMatcher:
                 'matching_chunks_count': chunk_count,
                 'total_similarity': round(total_score, 4),
                 'average_similarity': round(avg_score, 4),
-                'top_matching_chunks': resume_top_chunks[resume_id][:5],  # Top 5 chunks
+                'top_matching_chunks': [
+                    {
+                        'chunk_id': chunk['chunk_id'],
+                        'field': chunk['metadata'].get('field', 'unknown'),
+                        'content': truncate_text(chunk['content'], Config.CHUNK_PREVIEW_LENGTH),
+                        'similarity': similarity
+                    }
+                    for similarity, _, chunk in sorted(resume_top_chunks[resume_id], reverse=True)
+                ],
                 'matching_mode': 'rough'
             })
 
@@ -451,18 +699,18 @@ class ResumeJDMatcher:
         top_resumes = rough_results[:precise_top_n]
         top_resume_ids = [r['resume_id'] for r in top_resumes]
 
-        # Step 3: Prepare resume chunks for precise matching
-        resume_chunks_list = []
-        for resume_id in top_resume_ids:
-            resume_chunks = db_storage.get_chunks_by_document(resume_id)
-            if resume_chunks:
-                resume_chunks_list.append((resume_id, resume_chunks))
+        # Step 3: Prepare resume chunks for precise matching (single batched query)
+        chunks_by_resume = db_storage.get_chunks_by_documents(top_resume_ids)
+        resume_chunks_list = [
+            (resume_id, chunks_by_resume[resume_id])
+            for resume_id in top_resume_ids
+            if resume_id in chunks_by_resume
+        ]
 
         # Step 4: Run precise matching on filtered resumes
         precise_results = []
-        for resume_id, resume_chunks in resume_chunks_list:
-            logger.debug(f"[Hybrid Mode] Analyzing {resume_id} with LLM")
-            precise_result = self.match_resume_with_jd(resume_chunks, jd_chunks)
+        precise_matches = self._precise_match_many(resume_chunks_list, jd_chunks)
+        for (resume_id, _), precise_result in zip(resume_chunks_list, precise_matches):
             precise_result['resume_id'] = resume_id
 
             # Add rough matching info to precise result
@@ -481,11 +729,13 @@ class ResumeJDMatcher:
             result['matching_mode'] = 'hybrid_rough_only'
             result['note'] = 'Filtered out after rough matching - did not qualify for precise analysis'
 
-        # Combine results
-        all_results = precise_results + remaining_resumes
-
-        # Sort by match_score descending (precise results will naturally rank higher)
-        all_results.sort(key=lambda x: x.get('match_score', 0), reverse=True)
+        # Combine results by match_score descending. Remaining rough results are
+        # already sorted, so only the (small) precise block needs sorting before
+        # a linear merge; ties keep precise results first, as a stable sort would.
+        precise_results.sort(key=_match_score_key, reverse=True)
+        all_results = list(heapq.merge(
+            precise_results, remaining_resumes, key=_match_score_key, reverse=True
+        ))
 
         logger.info(
             f"[Hybrid Mode] Complete: {len(precise_results)} with precise analysis, "
@@ -523,25 +773,13 @@ class ResumeJDMatcher:
 
             # Get or compute match result
             if match_result is None:
-                match_result = self.match_resume_with_jd(resume_chunks, jd_chunks)
+                match_result = self.match_resume_with_jd(resume_chunks, jd_chunks, resume_id)
 
             # Extract resume content by field
-            resume_by_field = {}
-            for chunk in resume_chunks:
-                field = chunk.get('metadata', {}).get('field', 'unknown')
-                content = chunk.get('content', '')
-                if field not in resume_by_field:
-                    resume_by_field[field] = []
-                resume_by_field[field].append(content)
+            resume_by_field = _group_contents_by_field(resume_chunks)
 
             # Extract JD requirements by field
-            jd_by_field = {}
-            for chunk in jd_chunks:
-                field = chunk.get('metadata', {}).get('field', 'unknown')
-                content = chunk.get('content', '')
-                if field not in jd_by_field:
-                    jd_by_field[field] = []
-                jd_by_field[field].append(content)
+            jd_by_field = _group_contents_by_field(jd_chunks)
 
             # Build explanation
             explanation = {
@@ -1,5 +1,10 @@
+import asyncio
+import copy
+import hashlib
 import json
-from typing import List, Dict
+import uuid
+from collections import OrderedDict
+from typing import List, Dict, Iterator, Optional, Tuple
 import sys
 import os
 
@@ -8,23 +13,191 @@ sys.path.append(parent_dir)
 
 from config import Config
 from prompt.extract_job_description import generate_job_description_prompt
-import google.generativeai as genai
 from utils.chunk_size_manager import validate_and_split_chunks
-from utils.text_utils import normalize_text, extract_json_from_text
+from utils.text_utils import normalize_text, extract_json_from_text, parse_json
+from utils.llm_client import get_generative_model, run_async
 from utils.logger import get_logger, log_execution_time
 from utils.exceptions import MissingAPIKeyError, LLMError
 
 # Initialize logger
 logger = get_logger(__name__)
 
+# Scalar (string) fields of the JD extraction schema
+_JD_SCALAR_FIELDS = ('title', 'company', 'location', 'employment_type', 'salary', 'about_company')
+
+# List-of-strings fields of the JD extraction schema
+_JD_LIST_FIELDS = ('certifications', 'responsibilities', 'benefits')
+
+# (field, label) pairs rendered into the additional info chunk, in order
+_ADDITIONAL_INFO_FIELDS = (
+    ('title', 'Position'),
+    ('company', 'Company'),
+    ('location', 'Location'),
+    ('employment_type', 'Employment Type'),
+    ('salary', 'Salary'),
+    ('benefits', 'Benefits'),
+    ('about_company', 'About'),
+)
+
+# Leading markers of a list item that is already bulleted. '-' and '*' need
+# the following space, so '-based' or markdown bold ('**Lead**') don't match
+_BULLET_PREFIXES = ('- ', '* ', '•')
+
+
+def _as_str_list(value) -> List[str]:
+    """Coerce a list-valued JD field to a list of strings"""
+    if not value:
+        return []
+    if isinstance(value, list):
+        return [str(item) for item in value]
+    return [str(value)]
+
+
+def _as_dict_list(value) -> List[Dict]:
+    """Coerce a list-of-objects JD field to a list of dicts"""
+    if not isinstance(value, list):
+        return []
+    return [item for item in value if isinstance(item, dict)]
+
+
+def coerce_jd_schema(jd_json: Dict) -> Dict:
+    """
+    Validate parsed JD data once against the extraction schema
+
+    LLM output may omit keys or use the wrong types (e.g. a string where a
+    list is expected). This returns a dict where every schema field is
+    present with the expected type, so chunk generation needs no per-field
+    type checks.
+
+    Args:
+        jd_json: Parsed JD data from the LLM
+
+    Returns:
+        Dictionary with guaranteed field types
+    """
+    skills = jd_json.get('skills')
+    if not isinstance(skills, dict):
+        skills = {}
+
+    jd = {field: str(jd_json.get(field) or '') for field in _JD_SCALAR_FIELDS}
+    jd.update({field: _as_str_list(jd_json.get(field)) for field in _JD_LIST_FIELDS})
+    jd['skills'] = {
+        'technical': _as_str_list(skills.get('technical')),
+        'soft': _as_str_list(skills.get('soft'))
+    }
+    jd['experience'] = _as_dict_list(jd_json.get('experience'))
+    jd['education'] = _as_dict_list(jd_json.get('education'))
+    return jd
+
+
+def _skills_section(jd: Dict) -> Iterator[Tuple[str, str, Optional[int]]]:
+    """Skills chunk (matching resume skills format)"""
+    skills_parts = []
+    technical_skills = jd['skills']['technical']
+    if technical_skills:
+        skills_parts.append(f"Technical Skills: {', '.join(technical_skills)}")
+    soft_skills = jd['skills']['soft']
+    if soft_skills:
+        skills_parts.append(f"Soft Skills: {', '.join(soft_skills)}")
+
+    if skills_parts:
+        yield "skills", ' | '.join(skills_parts), None
+
+
+def _experience_section(jd: Dict) -> Iterator[Tuple[str, str, Optional[int]]]:
+    """Experience chunks (matching resume experience format)"""
+    for i, exp in enumerate(jd['experience']):
+        exp_parts = []
+        years = exp.get('years_required', '')
+        level = exp.get('level', '')
+        desc = exp.get('description', '')
+
+        if years:
+            exp_parts.append(f"Years Required: {years}")
+        if level:
+            exp_parts.append(f"Level: {level}")
+        if desc:
+            exp_parts.append(f"Description: {desc}")
+
+        if exp_parts:
+            yield "experience", ' | '.join(exp_parts), i
+
+
+def _education_section(jd: Dict) -> Iterator[Tuple[str, str, Optional[int]]]:
+    """Education chunks (matching resume education format)"""
+    for i, edu in enumerate(jd['education']):
+        degree = edu.get('degree', '')
+        field = edu.get('field', '')
+        reqs = edu.get('requirements', '')
+
+        edu_parts = []
+        if degree and field:
+            edu_parts.append(f"{degree} in {field}")
+        elif degree:
+            edu_parts.append(degree)
+        elif field:
+            edu_parts.append(f"Degree in {field}")
+
+        if reqs:
+            edu_parts.append(f"Requirements: {reqs}")
+
+        if edu_parts:
+            yield "education", ' | '.join(edu_parts), i
+
+
+def _certifications_section(jd: Dict) -> Iterator[Tuple[str, str, Optional[int]]]:
+    """Certifications chunk (matching resume certifications format)"""
+    certifications = jd['certifications']
+    if certifications:
+        yield "certifications", f"Required Certifications: {', '.join(certifications)}", None
+
+
+def _responsibilities_section(jd: Dict) -> Iterator[Tuple[str, str, Optional[int]]]:
+    """Responsibilities chunk"""
+    responsibilities = jd['responsibilities']
+    if responsibilities:
+        # The LLM sometimes returns some items already bulleted; don't bullet them twice
+        resp_str = '\n'.join(
+            item if item.lstrip().startswith(_BULLET_PREFIXES) else f"- {item}"
+            for item in responsibilities
+        )
+        yield "responsibilities", f"Key Responsibilities:\n{resp_str}", None
+
+
+def _additional_info_section(jd: Dict) -> Iterator[Tuple[str, str, Optional[int]]]:
+    """Additional info chunk (company, benefits, etc.)"""
+    additional_parts = []
+    for field, label in _ADDITIONAL_INFO_FIELDS:
+        value = jd[field]
+        if value:
+            if isinstance(value, list):
+                value = ', '.join(value)
+            additional_parts.append(f"{label}: {value}")
+
+    if additional_parts:
+        yield "additional_info", ' | '.join(additional_parts), None
+
+
+# Section builders in chunk order. Each takes schema-coerced JD data and
+# yields (field_name, content, chunk_index) specs.
+_JD_SECTION_BUILDERS = (
+    _skills_section,
+    _experience_section,
+    _education_section,
+    _certifications_section,
+    _responsibilities_section,
+    _additional_info_section,
+)
+
 
 class JDPreprocessor:
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, enable_cache: bool = True):
         """
         Initialize job description preprocessor with LLM client
 
         Args:
             api_key: Google API key (optional, will use config if not provided)
+            enable_cache: Whether to cache parsed JDs in memory
 
         Raises:
             MissingAPIKeyError: If API key is not found
@@ -39,10 +212,16 @@ class JDPreprocessor:
                     "Google API key not found. Please set GOOGLE_API_KEY in .env file"
                 )
 
-            genai.configure(api_key=api_key)
-            self.llm_client = genai.GenerativeModel(Config.JD_LLM_MODEL)
+            self.llm_client = get_generative_model(api_key, Config.JD_LLM_MODEL)
             logger.debug(f"LLM client initialized with {Config.JD_LLM_MODEL}")
 
+            # The extraction prompt is static, so build it once per instance
+            self._jd_prompt = generate_job_description_prompt()
+
+            # In-memory LRU of parsed JDs keyed by JD text hash
+            self.enable_cache = enable_cache if enable_cache is not None else Config.ENABLE_CACHE
+            self._parse_cache = OrderedDict()
+
             logger.info("JDPreprocessor initialization completed")
 
         except Exception as e:
@@ -66,7 +245,13 @@ class JDPreprocessor:
         try:
             logger.info("Parsing job description with LLM")
 
-            prompt = generate_job_description_prompt()
+            cache_key = self._get_parse_cache_key(jd_text)
+            cached_result = self._get_cached_parse(cache_key)
+            if cached_result is not None:
+                logger.info("Using cached JD parse (cache hit)")
+                return cached_result
+
+            prompt = self._jd_prompt
 
             try:
                 response = self.llm_client.generate_content([prompt, jd_text])
@@ -78,13 +263,137 @@ class JDPreprocessor:
                     details={'model': Config.JD_LLM_MODEL}
                 )
 
-            logger.debug(f"Received response ({len(response_text)} chars)")
+            data = self._parse_response(response_text, jd_text)
+            self._remember_parse(cache_key, data)
+            return data
+
+        except Exception as e:
+            logger.error(f"JD parsing failed: {str(e)}", exc_info=True)
+            if isinstance(e, LLMError):
+                raise
+            raise LLMError(
+                f"Failed to parse job description: {str(e)}",
+                details={'error_type': type(e).__name__}
+            )
+    
+    @log_execution_time(logger)
+    async def parse_with_llm_async(self, jd_text: str) -> Dict[str, str]:
+        """
+        Parse job description using the async LLM client
+
+        Args:
+            jd_text: Job description text
+
+        Returns:
+            Dictionary containing parsed JD data
+
+        Raises:
+            LLMError: If LLM API call fails
+        """
+        try:
+            logger.info("Parsing job description with LLM (async)")
+
+            cache_key = self._get_parse_cache_key(jd_text)
+            cached_result = self._get_cached_parse(cache_key)
+            if cached_result is not None:
+                logger.info("Using cached JD parse (cache hit)")
+                return cached_result
+
+            prompt = self._jd_prompt
+
+            try:
+                response = await self.llm_client.generate_content_async([prompt, jd_text])
+                response_text = response.text.strip()
+            except Exception as e:
+                logger.error(f"LLM API call failed: {str(e)}", exc_info=True)
+                raise LLMError(
+                    f"Failed to call LLM API: {str(e)}",
+                    details={'model': Config.JD_LLM_MODEL}
+                )
+
+            data = self._parse_response(response_text, jd_text)
+            self._remember_parse(cache_key, data)
+            return data
+
+        except Exception as e:
+            logger.error(f"JD parsing failed: {str(e)}", exc_info=True)
+            if isinstance(e, LLMError):
+                raise
+            raise LLMError(
+                f"Failed to parse job description: {str(e)}",
+                details={'error_type': type(e).__name__}
+            )
+
+    @staticmethod
+    def _get_parse_cache_key(jd_text: str) -> bytes:
+        """Hash JD text into a compact cache key"""
+        return hashlib.blake2b(jd_text.encode('utf-8'), digest_size=16).digest()
+
+    def _get_cached_parse(self, cache_key: bytes) -> Optional[Dict]:
+        """
+        Look up a parsed JD in the in-memory LRU
+
+        Args:
+            cache_key: Key from _get_parse_cache_key
 
+        Returns:
+            Deep copy of the cached parse result, or None on miss or when caching is disabled
+        """
+        if not self.enable_cache:
+            return None
+
+        data = self._parse_cache.get(cache_key)
+        if data is None:
+            return None
+        self._parse_cache.move_to_end(cache_key)
+        # Parse results nest lists (skills, responsibilities) that callers may edit
+        return copy.deepcopy(data)
+
+    def _remember_parse(self, cache_key: bytes, data: Dict):
+        """Cache a parse result, evicting the oldest entries beyond the size limit"""
+        # Only full_text means no JSON was extracted; let the next call retry the LLM
+        if not self.enable_cache or len(data) <= 1:
+            return
+
+        self._parse_cache[cache_key] = copy.deepcopy(data)
+        self._parse_cache.move_to_end(cache_key)
+        while len(self._parse_cache) > Config.JD_PARSE_CACHE_MAX_SIZE:
+            self._parse_cache.popitem(last=False)
+
+    def clear_cache(self):
+        """Clear the in-memory JD parse cache"""
+        self._parse_cache.clear()
+        logger.info("JD parse cache cleared")
+
+    def _parse_response(self, response_text: str, jd_text: str) -> Dict[str, str]:
+        """
+        Extract and normalize JD data from an LLM response
+
+        Args:
+            response_text: Raw LLM response text
+            jd_text: Original job description text
+
+        Returns:
+            Dictionary containing parsed JD data
+        """
+        logger.debug(f"Received response ({len(response_text)} chars)")
+
+        # Fast path: the response is already a bare JSON object
+        data = None
+        if response_text.startswith('{'):
+            try:
+                data = parse_json(response_text)
+            except json.JSONDecodeError:
+                data = None
+
+        if isinstance(data, dict):
+            logger.debug("Response parsed as valid JSON")
+        else:
             # Extract JSON using utility function
             json_str = extract_json_from_text(response_text)
             if json_str:
                 try:
-                    data = json.loads(json_str)
+                    data = parse_json(json_str)
                     logger.debug("Response parsed as valid JSON")
                 except json.JSONDecodeError as e:
                     logger.error(f"Failed to parse JSON: {str(e)}")
@@ -93,28 +402,18 @@ class JDPreprocessor:
                 logger.warning("No JSON found in response, using empty dict")
                 data = {}
 
-            # Normalize string values only (skip nested dicts/lists)
-            normalized_data = {}
-            for key, val in data.items():
-                if isinstance(val, str):
-                    normalized_data[key] = normalize_text(val)
-                else:
-                    normalized_data[key] = val
+        # Normalize string values only (skip nested dicts/lists). The JSON
+        # parser only produces exact str instances, so an identity check suffices
+        normalized_data = {
+            key: normalize_text(val) if type(val) is str else val
+            for key, val in data.items()
+        }
 
-            normalized_data["full_text"] = normalize_text(jd_text)
+        normalized_data["full_text"] = normalize_text(jd_text)
 
-            logger.info("Job description parsed successfully")
-            return normalized_data
+        logger.info("Job description parsed successfully")
+        return normalized_data
 
-        except Exception as e:
-            logger.error(f"JD parsing failed: {str(e)}", exc_info=True)
-            if isinstance(e, LLMError):
-                raise
-            raise LLMError(
-                f"Failed to parse job description: {str(e)}",
-                details={'error_type': type(e).__name__}
-            )
-    
     def generate_hybrid_chunks(
             self,
             jd_json: Dict,
@@ -131,132 +430,35 @@ class JDPreprocessor:
             List of chunk dictionaries
         """
         if jd_id is None:
-            import uuid
-            jd_id = f"jd_{uuid.uuid4().hex[:12]}"
-
-        chunks = []
-
-        def add_chunk(field_name: str, content: str, chunk_index: int = None):
-            """Add chunk to list"""
-            if content.strip():
-                chunk_suffix = f"_{chunk_index}_{field_name}" if chunk_index is not None else f"_{field_name}"
-                chunks.append({
-                    "chunk_id": f"{jd_id}{chunk_suffix}",
-                    "field": field_name,
-                    "content": content.strip(),
-                    "metadata": {
-                        "document_id": jd_id,
-                        "document_type": "job_description",
-                        "field": field_name,
-                    }
-                })
-
-        # Extract skills (matching resume format)
-        skills = jd_json.get('skills', {})
-        technical_skills = skills.get('technical', []) if isinstance(skills, dict) else []
-        soft_skills = skills.get('soft', []) if isinstance(skills, dict) else []
-
-        # Skills chunk (matching resume skills format)
-        skills_parts = []
-        if technical_skills:
-            tech_str = ', '.join(technical_skills) if isinstance(technical_skills, list) else str(technical_skills)
-            skills_parts.append(f"Technical Skills: {tech_str}")
-        if soft_skills:
-            soft_str = ', '.join(soft_skills) if isinstance(soft_skills, list) else str(soft_skills)
-            skills_parts.append(f"Soft Skills: {soft_str}")
-
-        if skills_parts:
-            add_chunk("skills", ' | '.join(skills_parts))
-
-        # Experience chunks (matching resume experience format)
-        experiences = jd_json.get('experience', [])
-        if isinstance(experiences, list):
-            for i, exp in enumerate(experiences):
-                exp_parts = []
-                years = exp.get('years_required', '')
-                level = exp.get('level', '')
-                desc = exp.get('description', '')
-
-                if years:
-                    exp_parts.append(f"Years Required: {years}")
-                if level:
-                    exp_parts.append(f"Level: {level}")
-                if desc:
-                    exp_parts.append(f"Description: {desc}")
-
-                if exp_parts:
-                    add_chunk("experience", ' | '.join(exp_parts), i)
-
-        # Education chunks (matching resume education format)
-        educations = jd_json.get('education', [])
-        if isinstance(educations, list):
-            for i, edu in enumerate(educations):
-                degree = edu.get('degree', '')
-                field = edu.get('field', '')
-                reqs = edu.get('requirements', '')
-
-                edu_parts = []
-                if degree and field:
-                    edu_parts.append(f"{degree} in {field}")
-                elif degree:
-                    edu_parts.append(degree)
-                elif field:
-                    edu_parts.append(f"Degree in {field}")
-
-                if reqs:
-                    edu_parts.append(f"Requirements: {reqs}")
-
-                if edu_parts:
-                    add_chunk("education", ' | '.join(edu_parts), i)
-
-        # Certifications chunk (matching resume certifications format)
-        certifications = jd_json.get('certifications', [])
-        if certifications:
-            certs_str = ', '.join(certifications) if isinstance(certifications, list) else str(certifications)
-            add_chunk("certifications", f"Required Certifications: {certs_str}")
-
-        # Responsibilities chunk
-        responsibilities = jd_json.get('responsibilities', [])
-        if responsibilities:
-            resp_str = '\n'.join([f"- {r}" for r in responsibilities]) if isinstance(responsibilities, list) else str(responsibilities)
-            add_chunk("responsibilities", f"Key Responsibilities:\n{resp_str}")
-
-        # Additional info chunk (company, benefits, etc.)
-        additional_parts = []
-
-        title = jd_json.get('title', '')
-        if title:
-            additional_parts.append(f"Position: {title}")
-
-        company = jd_json.get('company', '')
-        if company:
-            additional_parts.append(f"Company: {company}")
-
-        location = jd_json.get('location', '')
-        if location:
-            additional_parts.append(f"Location: {location}")
-
-        employment_type = jd_json.get('employment_type', '')
-        if employment_type:
-            additional_parts.append(f"Employment Type: {employment_type}")
-
-        salary = jd_json.get('salary', '')
-        if salary:
-            additional_parts.append(f"Salary: {salary}")
-
-        benefits = jd_json.get('benefits', [])
-        if benefits:
-            ben_str = ', '.join(benefits) if isinstance(benefits, list) else str(benefits)
-            additional_parts.append(f"Benefits: {ben_str}")
-
-        about_company = jd_json.get('about_company', '')
-        if about_company:
-            additional_parts.append(f"About: {about_company}")
-
-        if additional_parts:
-            add_chunk("additional_info", ' | '.join(additional_parts))
-
-        return chunks
+            jd_id = f"jd_{uuid.uuid4().bytes[:6].hex()}"
+
+        # Validate field types once instead of per-field isinstance checks
+        jd = coerce_jd_schema(jd_json)
+
+        # (field_name, content, chunk_index) specs, turned into chunk dicts at the end
+        chunk_specs = []
+        for build_section in _JD_SECTION_BUILDERS:
+            for field_name, content, chunk_index in build_section(jd):
+                content = content.strip()
+                if content:
+                    chunk_specs.append((field_name, content, chunk_index))
+
+        # Metadata shared by every chunk of this JD; each chunk adds its field
+        base_metadata = {
+            "document_id": jd_id,
+            "document_type": "job_description",
+        }
+        id_prefix = f"{jd_id}_"
+
+        return [
+            {
+                "chunk_id": id_prefix + field_name if chunk_index is None else f"{id_prefix}{chunk_index}_{field_name}",
+                "field": field_name,
+                "content": content,
+                "metadata": {**base_metadata, "field": field_name}
+            }
+            for field_name, content, chunk_index in chunk_specs
+        ]
         
     @log_execution_time(logger)
     def preprocess_jd(self, jd_text: str, jd_id: str) -> List[Dict[str, str]]:
@@ -277,17 +479,60 @@ class JDPreprocessor:
             logger.info(f"Preprocessing job description (ID: {jd_id})")
 
             sections = self.parse_with_llm(jd_text)
+            return self._build_chunks(sections, jd_id)
+
+        except Exception as e:
+            logger.error(f"JD preprocessing failed: {str(e)}", exc_info=True)
+            if isinstance(e, LLMError):
+                raise
+            raise LLMError(
+                f"Failed to preprocess job description: {str(e)}",
+                details={'jd_id': jd_id, 'error_type': type(e).__name__}
+            )
+        
+
+    def _build_chunks(self, sections: Dict, jd_id: str) -> List[Dict[str, str]]:
+        """
+        Generate chunks from parsed JD data and optimize their sizes
 
-            # Generate chunks
-            chunks = self.generate_hybrid_chunks(sections, jd_id)
-            logger.debug(f"Generated {len(chunks)} chunks")
+        Args:
+            sections: Parsed JD data
+            jd_id: Unique identifier for the job description
 
-            # Optimize chunk sizes for better matching accuracy
-            logger.debug("Optimizing JD chunk sizes")
-            optimized_chunks = validate_and_split_chunks(chunks)
-            logger.info(f"JD chunk optimization complete: {len(chunks)} → {len(optimized_chunks)} chunks")
+        Returns:
+            List of optimized chunk dictionaries
+        """
+        # Generate chunks
+        chunks = self.generate_hybrid_chunks(sections, jd_id)
+        logger.debug(f"Generated {len(chunks)} chunks")
+
+        # Optimize chunk sizes for better matching accuracy
+        logger.debug("Optimizing JD chunk sizes")
+        optimized_chunks = validate_and_split_chunks(chunks)
+        logger.info(f"JD chunk optimization complete: {len(chunks)} → {len(optimized_chunks)} chunks")
 
-            return optimized_chunks
+        return optimized_chunks
+
+    @log_execution_time(logger)
+    async def preprocess_jd_async(self, jd_text: str, jd_id: str) -> List[Dict[str, str]]:
+        """
+        Preprocess job description into optimized chunks using the async LLM client
+
+        Args:
+            jd_text: Job description text
+            jd_id: Unique identifier for the job description
+
+        Returns:
+            List of optimized chunk dictionaries
+
+        Raises:
+            LLMError: If preprocessing fails
+        """
+        try:
+            logger.info(f"Preprocessing job description async (ID: {jd_id})")
+
+            sections = await self.parse_with_llm_async(jd_text)
+            return self._build_chunks(sections, jd_id)
 
         except Exception as e:
             logger.error(f"JD preprocessing failed: {str(e)}", exc_info=True)
@@ -297,4 +542,69 @@ class JDPreprocessor:
                 f"Failed to preprocess job description: {str(e)}",
                 details={'jd_id': jd_id, 'error_type': type(e).__name__}
             )
-        
+
+    async def preprocess_jds(
+        self,
+        items: List[Tuple[str, str]],
+        concurrency: int = None
+    ) -> List[List[Dict[str, str]]]:
+        """
+        Preprocess multiple job descriptions concurrently
+
+        LLM calls run concurrently, bounded by a semaphore, so bulk imports are
+        limited by the Gemini rate limit rather than serial request latency.
+
+        Args:
+            items: List of (jd_text, jd_id) tuples
+            concurrency: Maximum concurrent LLM requests (default from config)
+
+        Returns:
+            List of optimized chunk lists, in the same order as items
+
+        Raises:
+            LLMError: If preprocessing of any job description fails
+        """
+        if concurrency is None:
+            concurrency = Config.LLM_CONCURRENCY
+
+        logger.info(f"Preprocessing {len(items)} job descriptions (concurrency={concurrency})")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def preprocess_one(jd_text: str, jd_id: str) -> List[Dict[str, str]]:
+            async with semaphore:
+                return await self.preprocess_jd_async(jd_text, jd_id)
+
+        return await asyncio.gather(*(preprocess_one(jd_text, jd_id) for jd_text, jd_id in items))
+
+    @log_execution_time(logger)
+    def preprocess_jd_batch(
+        self,
+        jd_texts: List[str],
+        jd_ids: List[str],
+        concurrency: int = None
+    ) -> List[List[Dict[str, str]]]:
+        """
+        Preprocess a batch of job descriptions from synchronous code
+
+        Runs preprocess_jds on the shared LLM event loop (see run_async), so
+        callers such as the Streamlit app get concurrent LLM calls without
+        managing asyncio, and repeated calls reuse the same async client.
+
+        Args:
+            jd_texts: Job description texts
+            jd_ids: Unique identifiers, one per text
+            concurrency: Maximum concurrent LLM requests (default from config)
+
+        Returns:
+            List of optimized chunk lists, in the same order as jd_texts
+
+        Raises:
+            ValueError: If jd_texts and jd_ids differ in length
+            LLMError: If preprocessing of any job description fails
+        """
+        if len(jd_texts) != len(jd_ids):
+            raise ValueError(
+                f"Got {len(jd_texts)} job descriptions but {len(jd_ids)} IDs"
+            )
+
+        return run_async(self.preprocess_jds(list(zip(jd_texts, jd_ids)), concurrency))
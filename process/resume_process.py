@@ -7,13 +7,18 @@ sys.path.append(parent_dir)
 from config import Config
 from prompt.extract_resume import generate_resume_extraction_prompt
 from typing import List, Dict, Union, Tuple
+import asyncio
 import json
 import hashlib
+import io
+import time
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
 from utils.cache_manager import create_text_cache
 from utils.chunk_size_manager import validate_and_split_chunks
+from utils.llm_client import get_generative_model
 from utils.logger import get_logger, log_execution_time
-from utils.text_utils import extract_json_from_text
+from utils.text_utils import extract_json_from_text, parse_json
 from utils.exceptions import (
     ResumeParsingError,
     PDFExtractionError,
@@ -46,14 +51,25 @@ class ResumePreprocessor:
                     "Google API key not found. Please set GOOGLE_API_KEY in .env file"
                 )
 
-            genai.configure(api_key=api_key)
-            self.llm_client = genai.GenerativeModel(Config.RESUME_LLM_MODEL)
+            self.llm_client = get_generative_model(api_key, Config.RESUME_LLM_MODEL)
             logger.debug(f"LLM client initialized with {Config.RESUME_LLM_MODEL}")
 
+            # The extraction prompt is static, so build it once per instance
+            self._resume_prompt = generate_resume_extraction_prompt()
+
+            # Ask Gemini for a bare JSON response so it can be parsed directly
+            self._json_generation_config = genai.types.GenerationConfig(
+                response_mime_type='application/json'
+            )
+
+            # In-flight async LLM calls by cache key, for coalescing duplicates
+            self._inflight = {}
+
             # Initialize cache
             self.enable_cache = enable_cache if enable_cache is not None else Config.ENABLE_CACHE
             if self.enable_cache:
-                self.cache = create_text_cache(cache_dir=Config.RESUME_CACHE_DIR)
+                # Writes are persisted in the background, off the request path
+                self.cache = create_text_cache(cache_dir=Config.RESUME_CACHE_DIR, background_writes=True)
                 logger.info("LLM response caching enabled")
             else:
                 logger.info("LLM response caching disabled")
@@ -72,6 +88,93 @@ class ResumePreprocessor:
             # For PDF bytes, use hash as cache key
             return hashlib.sha256(content).hexdigest()
 
+    def _upload_pdf(self, pdf_bytes: bytes, cache_key: str):
+        """
+        Upload PDF bytes to Gemini and wait until the file is processed
+
+        Args:
+            pdf_bytes: PDF file bytes
+            cache_key: PDF hash from _get_cache_key, used in the display name
+
+        Returns:
+            Uploaded Gemini file handle
+
+        Raises:
+            PDFExtractionError: If processing fails or times out
+        """
+        logger.info("Uploading PDF to Gemini for processing")
+
+        # Upload directly from memory (no temporary file)
+        uploaded_file = genai.upload_file(
+            io.BytesIO(pdf_bytes),
+            mime_type='application/pdf',
+            display_name=f"resume_{cache_key[:12]}.pdf"
+        )
+        logger.debug(f"PDF uploaded: {uploaded_file.name}")
+
+        # Wait for file processing, polling with exponential backoff until the deadline
+        try:
+            start = time.monotonic()
+            deadline = start + Config.PDF_UPLOAD_TIMEOUT_SECONDS
+            delay = Config.PDF_POLL_INITIAL_DELAY
+            while uploaded_file.state.name == "PROCESSING":
+                if time.monotonic() >= deadline:
+                    raise PDFExtractionError(
+                        "PDF processing timeout",
+                        details={'elapsed_s': round(time.monotonic() - start, 1)}
+                    )
+                logger.debug(f"Processing PDF (next check in {delay:.1f}s)")
+                time.sleep(delay)
+                delay = min(delay * 2, Config.PDF_POLL_MAX_DELAY)
+                uploaded_file = genai.get_file(uploaded_file.name)
+
+            if uploaded_file.state.name == "FAILED":
+                raise PDFExtractionError("PDF processing failed on server")
+        except Exception:
+            # Don't leave an unusable upload on the server
+            self._delete_uploaded_pdf(uploaded_file)
+            raise
+
+        return uploaded_file
+
+    def _delete_uploaded_pdf(self, uploaded_file):
+        """Delete an uploaded resume from Gemini (it contains personal data)"""
+        try:
+            genai.delete_file(uploaded_file.name)
+            logger.debug("Cleaned up uploaded file")
+        except Exception as e:
+            logger.warning(f"Failed to delete uploaded file {uploaded_file.name}: {str(e)}")
+
+    def _text_prompt(self, resume_text: str) -> str:
+        """Build the text-based extraction prompt"""
+        return f"{self._resume_prompt} Resume Text:\n{resume_text}\n"
+
+    async def _generate_content_async(self, contents):
+        """
+        Call the async Gemini API, backing off exponentially on quota errors
+
+        Args:
+            contents: Prompt or list of prompt parts
+
+        Returns:
+            Gemini response
+
+        Raises:
+            google.api_core.exceptions.ResourceExhausted: If retries are exhausted
+        """
+        for attempt in range(Config.LLM_MAX_RETRIES + 1):
+            try:
+                return await self.llm_client.generate_content_async(
+                    contents, generation_config=self._json_generation_config
+                )
+            except google_exceptions.ResourceExhausted:
+                if attempt == Config.LLM_MAX_RETRIES:
+                    raise
+                delay = Config.LLM_RETRY_BASE_DELAY * 2 ** attempt
+                logger.warning(f"Gemini quota exceeded, retrying in {delay}s "
+                               f"(attempt {attempt+1}/{Config.LLM_MAX_RETRIES})")
+                await asyncio.sleep(delay)
+
     @log_execution_time(logger)
     def parse_with_llm(self, resume_input: Union[str, bytes], is_pdf: bool = False) -> Dict:
         """
@@ -106,44 +209,17 @@ class ResumePreprocessor:
             logger.debug("Cache miss - calling Gemini API")
 
             if is_pdf:
-                # Upload PDF file to Gemini
-                logger.info("Uploading PDF to Gemini for processing")
-
-                # Save PDF bytes to a temporary file for upload
-                import tempfile
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                    tmp_file.write(resume_input)
-                    tmp_path = tmp_file.name
-
                 try:
-                    # Upload file to Gemini
-                    uploaded_file = genai.upload_file(tmp_path)
-                    logger.debug(f"PDF uploaded: {uploaded_file.name}")
-
-                    # Wait for file processing
-                    import time
-                    attempts = 0
-                    max_attempts = Config.MAX_PDF_UPLOAD_ATTEMPTS
-                    while uploaded_file.state.name == "PROCESSING":
-                        logger.debug(f"Processing PDF (attempt {attempts+1}/{max_attempts})")
-                        time.sleep(1)
-                        uploaded_file = genai.get_file(uploaded_file.name)
-                        attempts += 1
-                        if attempts >= max_attempts:
-                            raise PDFExtractionError(
-                                "PDF processing timeout",
-                                details={'attempts': attempts}
-                            )
-
-                    if uploaded_file.state.name == "FAILED":
-                        raise PDFExtractionError("PDF processing failed on server")
-
-                    logger.debug("PDF processed successfully, generating content")
-                    response = self.llm_client.generate_content([generate_resume_extraction_prompt(), uploaded_file])
+                    uploaded_file = self._upload_pdf(resume_input, cache_key)
 
-                    # Clean up uploaded file
-                    genai.delete_file(uploaded_file.name)
-                    logger.debug("Cleaned up uploaded file")
+                    try:
+                        logger.debug("PDF processed successfully, generating content")
+                        response = self.llm_client.generate_content(
+                            [self._resume_prompt, uploaded_file],
+                            generation_config=self._json_generation_config
+                        )
+                    finally:
+                        self._delete_uploaded_pdf(uploaded_file)
 
                 except Exception as e:
                     logger.error(f"PDF processing error: {str(e)}", exc_info=True)
@@ -153,19 +229,14 @@ class ResumePreprocessor:
                         f"Failed to process PDF: {str(e)}",
                         details={'error_type': type(e).__name__}
                     )
-                finally:
-                    # Clean up temporary file
-                    if os.path.exists(tmp_path):
-                        os.unlink(tmp_path)
-                        logger.debug("Cleaned up temporary file")
             else:
                 # Use text-based prompt
                 logger.debug("Using text-based extraction")
-                prompt = generate_resume_extraction_prompt() + f""" Resume Text:
-                {resume_input}
-                """
                 try:
-                    response = self.llm_client.generate_content(prompt)
+                    response = self.llm_client.generate_content(
+                        self._text_prompt(resume_input),
+                        generation_config=self._json_generation_config
+                    )
                 except Exception as e:
                     logger.error(f"LLM API call failed: {str(e)}", exc_info=True)
                     raise LLMError(
@@ -173,15 +244,168 @@ class ResumePreprocessor:
                         details={'model': 'gemini-2.5-flash'}
                     )
 
-            # Parse response
-            response_text = response.text.strip()
-            logger.debug(f"Received response ({len(response_text)} chars)")
+            return self._parse_response(response.text, cache_key)
+
+        except Exception as e:
+            logger.error(f"Resume parsing failed: {str(e)}", exc_info=True)
+            if isinstance(e, (PDFExtractionError, LLMError, ResumeParsingError)):
+                raise
+            raise ResumeParsingError(
+                f"Unexpected error during resume parsing: {str(e)}",
+                details={'error_type': type(e).__name__}
+            )
 
+    @log_execution_time(logger)
+    async def parse_with_llm_async(self, resume_input: Union[str, bytes], is_pdf: bool = False) -> Dict:
+        """
+        Parse resume using the async LLM client
+
+        Blocking PDF upload and cleanup run in a worker thread; the Gemini
+        call itself is awaited and retried with backoff on quota errors.
+
+        Args:
+            resume_input: Either text string or PDF file bytes
+            is_pdf: True if resume_input is PDF bytes, False if it's text
+
+        Returns:
+            Dictionary containing parsed resume data
+
+        Raises:
+            PDFExtractionError: If PDF processing fails
+            LLMError: If LLM API call fails
+            ResumeParsingError: If response parsing fails
+        """
+        try:
+            logger.info(f"Parsing resume async (PDF: {is_pdf})")
+
+            # hashlib releases the GIL on large buffers, so hash PDFs in a worker
+            # thread to overlap with other in-flight requests
+            if is_pdf:
+                cache_key = await asyncio.to_thread(self._get_cache_key, resume_input)
+            else:
+                cache_key = self._get_cache_key(resume_input)
+
+            if self.enable_cache:
+                cached_result = self.cache.get(cache_key, max_age_days=Config.CACHE_MAX_AGE_DAYS)
+                if cached_result is not None:
+                    logger.info("Using cached LLM response (cache hit)")
+                    return cached_result
+
+            # Identical resumes submitted concurrently share a single LLM call.
+            # Waiters await it through shield(), so cancelling one waiter does
+            # not cancel the call for the others
+            task = self._inflight.get(cache_key)
+            if task is not None:
+                logger.info("Joining in-flight request for identical resume")
+                return await asyncio.shield(task)
+
+            logger.debug("Cache miss - calling Gemini API")
+            task = asyncio.ensure_future(self._call_llm_shared(resume_input, is_pdf, cache_key))
+            self._inflight[cache_key] = task
+            return await asyncio.shield(task)
+
+        except Exception as e:
+            logger.error(f"Resume parsing failed: {str(e)}", exc_info=True)
+            if isinstance(e, (PDFExtractionError, LLMError, ResumeParsingError)):
+                raise
+            raise ResumeParsingError(
+                f"Unexpected error during resume parsing: {str(e)}",
+                details={'error_type': type(e).__name__}
+            )
+
+    async def _call_llm_shared(self, resume_input: Union[str, bytes], is_pdf: bool, cache_key: str) -> Dict:
+        """Run _call_llm_async as the in-flight task for cache_key, unregistering it when done"""
+        try:
+            return await self._call_llm_async(resume_input, is_pdf, cache_key)
+        finally:
+            # Runs on success, error and cancellation of the shared task itself
+            if self._inflight.get(cache_key) is asyncio.current_task():
+                del self._inflight[cache_key]
+
+    async def _call_llm_async(self, resume_input: Union[str, bytes], is_pdf: bool, cache_key: str) -> Dict:
+        """
+        Run the async LLM extraction for a resume that missed the cache
+
+        Args:
+            resume_input: Either text string or PDF file bytes
+            is_pdf: True if resume_input is PDF bytes, False if it's text
+            cache_key: Key from _get_cache_key for the resume input
+
+        Returns:
+            Dictionary containing parsed resume data
+
+        Raises:
+            PDFExtractionError: If PDF processing fails
+            LLMError: If LLM API call fails
+            ResumeParsingError: If response parsing fails
+        """
+        if is_pdf:
+            try:
+                uploaded_file = await asyncio.to_thread(self._upload_pdf, resume_input, cache_key)
+
+                try:
+                    logger.debug("PDF processed successfully, generating content")
+                    response = await self._generate_content_async(
+                        [self._resume_prompt, uploaded_file]
+                    )
+                finally:
+                    await asyncio.to_thread(self._delete_uploaded_pdf, uploaded_file)
+
+            except Exception as e:
+                logger.error(f"PDF processing error: {str(e)}", exc_info=True)
+                if isinstance(e, (PDFExtractionError, LLMError)):
+                    raise
+                raise PDFExtractionError(
+                    f"Failed to process PDF: {str(e)}",
+                    details={'error_type': type(e).__name__}
+                )
+        else:
+            logger.debug("Using text-based extraction")
+            try:
+                response = await self._generate_content_async(self._text_prompt(resume_input))
+            except Exception as e:
+                logger.error(f"LLM API call failed: {str(e)}", exc_info=True)
+                raise LLMError(
+                    f"Failed to call LLM API: {str(e)}",
+                    details={'model': Config.RESUME_LLM_MODEL}
+                )
+
+        return self._parse_response(response.text, cache_key)
+
+    def _parse_response(self, response_text: str, cache_key: str) -> Dict:
+        """
+        Extract resume data from an LLM response and cache it
+
+        Args:
+            response_text: Raw LLM response text
+            cache_key: Key from _get_cache_key for the resume input
+
+        Returns:
+            Dictionary containing parsed resume data
+
+        Raises:
+            ResumeParsingError: If the response contains invalid JSON
+        """
+        logger.debug(f"Received response ({len(response_text)} chars)")
+
+        # Fast path: JSON mode responses are a bare JSON object. The text is not
+        # stripped first; the parser skips surrounding whitespace and the
+        # extraction fallback strips on its own
+        data = None
+        if response_text.startswith('{'):
+            try:
+                data = parse_json(response_text)
+            except json.JSONDecodeError:
+                data = None
+
+        if isinstance(data, dict):
+            logger.debug("Response parsed as valid JSON")
+        else:
             try:
                 # Extract JSON using utility function
                 json_str = extract_json_from_text(response_text)
                 if json_str:
-                    data = json.loads(json_str)
+                    data = parse_json(json_str)
                     logger.debug("Response parsed as valid JSON")
                 else:
                     data = {}
@@ -194,48 +418,40 @@ class ResumePreprocessor:
                     details={'response_preview': response_text[:Config.CHUNK_PREVIEW_LENGTH]}
                 )
 
-            # Ensure all required fields exist with default empty arrays
-            data.setdefault("name", "Unknown")
-            data.setdefault("experience", [])
-            data.setdefault("skills", [])
-            data.setdefault("education", [])
-            data.setdefault("projects", [])
+        # Ensure all required fields exist with default empty arrays
+        data.setdefault("name", "Unknown")
+        data.setdefault("experience", [])
+        data.setdefault("skills", [])
+        data.setdefault("education", [])
+        data.setdefault("projects", [])
 
-            logger.info(f"Resume parsed successfully: name={data.get('name')}, "
-                       f"skills={len(data.get('skills', []))}, "
-                       f"experience={len(data.get('experience', []))}")
+        logger.info(f"Resume parsed successfully: name={data.get('name')}, "
+                   f"skills={len(data.get('skills', []))}, "
+                   f"experience={len(data.get('experience', []))}")
 
-            # Save to cache for future use
-            if self.enable_cache:
-                self.cache.set(cache_key, data)
-                logger.debug("Response cached for future use")
+        # Save to cache for future use (written in the background)
+        if self.enable_cache:
+            self.cache.set(cache_key, data)
 
-            return data
-
-        except Exception as e:
-            logger.error(f"Resume parsing failed: {str(e)}", exc_info=True)
-            if isinstance(e, (PDFExtractionError, LLMError, ResumeParsingError)):
-                raise
-            raise ResumeParsingError(
-                f"Unexpected error during resume parsing: {str(e)}",
-                details={'error_type': type(e).__name__}
-            )
+        return data
 
     def generate_resume_chunks(self, resume_json, resume_id):
 
         chunks = []
 
+        # Metadata shared by every chunk of this resume; each chunk adds its field
+        base_metadata = {
+            "document_id": resume_id,
+            "document_type": "resume"
+        }
+
         # Skills
         if resume_json.get("skills"):
             chunks.append({
                 "chunk_id": f"{resume_id}_skills",
                 "field": "skills",
                 "content": "Skills: " + ", ".join(resume_json["skills"]),
-                "metadata": {
-                    "document_id": resume_id,
-                    "document_type": "resume",
-                    "field": "skills"
-                }
+                "metadata": {**base_metadata, "field": "skills"}
             })
             
         for i, exp in enumerate(resume_json.get("experience", [])):
@@ -245,29 +461,20 @@ class ResumePreprocessor:
             # Optional: include period/location in the text for context
             period = exp.get("period", "")
             location = exp.get("location", "")
-            
-            text_parts = [
-                f"Role: {exp.get('role', '')}",
-                f"Company: {exp.get('company', '')}"
-            ]
-            if period:
-                text_parts.append(f"Period: {period}")
-            if location:
-                text_parts.append(f"Location: {location}")
-            if achievements_text:
-                text_parts.append(f"Achievements: {achievements_text}")
-            
-            chunk_text = " | ".join(text_parts)
+
+            # Role and company are always present; optional parts only when non-empty
+            chunk_text = (
+                f"Role: {exp.get('role', '')} | Company: {exp.get('company', '')}"
+                + (f" | Period: {period}" if period else "")
+                + (f" | Location: {location}" if location else "")
+                + (f" | Achievements: {achievements_text}" if achievements_text else "")
+            )
             
             chunks.append({
                 "chunk_id": f"{resume_id}_{i}_experience",
                 "field": "experience",
                 "content": chunk_text.strip(),
-                "metadata": {
-                    "document_id": resume_id,
-                    "document_type": "resume",
-                    "field": "experience"
-                }
+                "metadata": {**base_metadata, "field": "experience"}
             })
 
         for i, edu in enumerate(resume_json.get("education", [])):
@@ -277,23 +484,17 @@ class ResumePreprocessor:
             details = edu.get("details", "")  # optional extra info
 
             # Build a single string to represent this education entry for embedding
-            text_parts = [f"{degree} at {school}"]  # required fields
-            if period:
-                text_parts.append(f"Period: {period}")
-            if details:
-                text_parts.append(details)
-
-            text = " | ".join(text_parts)
+            text = (
+                f"{degree} at {school}"  # required fields
+                + (f" | Period: {period}" if period else "")
+                + (f" | {details}" if details else "")
+            )
 
             chunks.append({
                 "chunk_id": f"{resume_id}_{i}_education",
                 "field": "education",
                 "content": text.strip(),
-                "metadata": {
-                    "document_id": resume_id,
-                    "document_type": "resume",
-                    "field": "education"
-                }
+                "metadata": {**base_metadata, "field": "education"}
             })
             
         for i, proj in enumerate(resume_json.get("projects", [])):
@@ -304,11 +505,7 @@ class ResumePreprocessor:
                 "chunk_id": f"{resume_id}_{i}_projects",
                 "field": "projects",
                 "content": text.strip(),
-                "metadata": {
-                    "document_id": resume_id,
-                    "document_type": "resume",
-                    "field": "projects"
-                }
+                "metadata": {**base_metadata, "field": "projects"}
             })
         
         return chunks
@@ -341,16 +538,67 @@ class ResumePreprocessor:
             sections = self.parse_with_llm(resume_input, is_pdf=is_pdf)
             logger.debug(f"Extracted {len(sections)} sections from resume")
 
-            # Generate chunks
-            chunks = self.generate_resume_chunks(sections, resume_id)
-            logger.debug(f"Generated {len(chunks)} chunks")
+            return self._build_chunks(sections, resume_id), sections
+
+        except Exception as e:
+            logger.error(f"Resume preprocessing failed: {str(e)}", exc_info=True)
+            if isinstance(e, (PDFExtractionError, LLMError, ResumeParsingError)):
+                raise
+            raise ResumeParsingError(
+                f"Failed to preprocess resume: {str(e)}",
+                details={'resume_id': resume_id, 'is_pdf': is_pdf}
+            )
+
+    def _build_chunks(self, sections: Dict, resume_id: str) -> List[Dict]:
+        """
+        Generate chunks from parsed resume data and optimize their sizes
+
+        Args:
+            sections: Parsed resume data
+            resume_id: Unique identifier for the resume
+
+        Returns:
+            List of optimized chunk dictionaries
+        """
+        # Generate chunks
+        chunks = self.generate_resume_chunks(sections, resume_id)
+        logger.debug(f"Generated {len(chunks)} chunks")
+
+        # Optimize chunk sizes for better matching accuracy
+        logger.debug("Optimizing chunk sizes")
+        optimized_chunks = validate_and_split_chunks(chunks)
+        logger.info(f"Chunk optimization complete: {len(chunks)} → {len(optimized_chunks)} chunks")
+
+        return optimized_chunks
+
+    @log_execution_time(logger)
+    async def preprocess_resume_async(
+        self,
+        resume_input: Union[str, bytes],
+        resume_id: str = None,
+        is_pdf: bool = False
+    ) -> Tuple[List[Dict], Dict]:
+        """
+        Preprocess resume from text or PDF using the async LLM client
+
+        Args:
+            resume_input: Either text string or PDF file bytes
+            resume_id: Unique identifier for the resume
+            is_pdf: True if resume_input is PDF bytes, False if it's text
+
+        Returns:
+            Tuple of (optimized_chunks, resume_data)
 
-            # Optimize chunk sizes for better matching accuracy
-            logger.debug("Optimizing chunk sizes")
-            optimized_chunks = validate_and_split_chunks(chunks)
-            logger.info(f"Chunk optimization complete: {len(chunks)} → {len(optimized_chunks)} chunks")
+        Raises:
+            ResumeParsingError: If preprocessing fails
+        """
+        try:
+            logger.info(f"Preprocessing resume async (ID: {resume_id}, PDF: {is_pdf})")
+
+            sections = await self.parse_with_llm_async(resume_input, is_pdf=is_pdf)
+            logger.debug(f"Extracted {len(sections)} sections from resume")
 
-            return optimized_chunks, sections
+            return self._build_chunks(sections, resume_id), sections
 
         except Exception as e:
             logger.error(f"Resume preprocessing failed: {str(e)}", exc_info=True)
@@ -360,3 +608,36 @@ class ResumePreprocessor:
                 f"Failed to preprocess resume: {str(e)}",
                 details={'resume_id': resume_id, 'is_pdf': is_pdf}
             )
+
+    async def preprocess_resumes(
+        self,
+        items: List[Tuple[Union[str, bytes], str, bool]],
+        concurrency: int = None
+    ) -> List[Tuple[List[Dict], Dict]]:
+        """
+        Preprocess multiple resumes concurrently
+
+        LLM calls run concurrently, bounded by a semaphore, so bulk uploads are
+        limited by the Gemini rate limit rather than serial request latency.
+
+        Args:
+            items: List of (resume_input, resume_id, is_pdf) tuples
+            concurrency: Maximum concurrent LLM requests (default from config)
+
+        Returns:
+            List of (optimized_chunks, resume_data) tuples, in the same order as items
+
+        Raises:
+            ResumeParsingError: If preprocessing of any resume fails
+        """
+        if concurrency is None:
+            concurrency = Config.LLM_CONCURRENCY
+
+        logger.info(f"Preprocessing {len(items)} resumes (concurrency={concurrency})")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def preprocess_one(resume_input, resume_id, is_pdf):
+            async with semaphore:
+                return await self.preprocess_resume_async(resume_input, resume_id, is_pdf)
+
+        return await asyncio.gather(*(preprocess_one(*item) for item in items))
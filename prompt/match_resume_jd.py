@@ -2,32 +2,10 @@
 Prompt template for matching resume with job description
 """
 
-def generate_match_prompt(resume_content: str, jd_content: str) -> str:
-    """
-    Generate a prompt to evaluate if a resume matches a job description
-
-    Args:
-        resume_content: Merged content from all resume chunks
-        jd_content: Job description content
-
-    Returns:
-        Formatted prompt for the LLM
-    """
-    prompt = f"""You are an expert HR recruiter and talent acquisition specialist. Your task is to evaluate whether a candidate's resume matches the requirements of a job description.
-
-# Job Description:
-{jd_content}
-
-# Candidate Resume:
-{resume_content}
-
-# Your Task:
-Analyze the resume against the job description and provide a detailed evaluation.
+from typing import List
 
-# Output Format:
-Respond ONLY with a valid JSON object in the following format (no markdown, no code blocks):
-
-{{
+# JSON object the LLM returns for each evaluated resume
+_MATCH_RESULT_SCHEMA = """{
     "qualified": true/false,
     "match_score": 0-100,
     "summary": "A brief 2-3 sentence summary of the candidate's fit",
@@ -42,28 +20,29 @@ Respond ONLY with a valid JSON object in the following format (no markdown, no c
         "Specific gap or weakness 3"
     ],
     "recommendation": "STRONG_MATCH / GOOD_MATCH / PARTIAL_MATCH / NOT_MATCH",
-    "detailed_analysis": {{
-        "skills_match": {{
+    "detailed_analysis": {
+        "skills_match": {
             "score": 0-100,
             "details": "Analysis of technical and soft skills alignment"
-        }},
-        "experience_match": {{
+        },
+        "experience_match": {
             "score": 0-100,
             "details": "Analysis of years and type of experience"
-        }},
-        "education_match": {{
+        },
+        "education_match": {
             "score": 0-100,
             "details": "Analysis of educational background alignment"
-        }},
-        "cultural_fit": {{
+        },
+        "cultural_fit": {
             "score": 0-100,
             "details": "Analysis based on values, work style, etc."
-        }}
-    }},
+        }
+    },
     "next_steps": "Recommended action (e.g., 'Schedule interview', 'Request more information', 'Reject politely')"
-}}
+}"""
 
-# Evaluation Criteria:
+# Scoring rules shared by the single and batch prompts
+_MATCH_GUIDELINES = """# Evaluation Criteria:
 1. **Skills Match**: Does the candidate have the required technical and soft skills?
 2. **Experience Match**: Does their work history align with the role requirements?
 3. **Education Match**: Do they meet educational requirements?
@@ -80,5 +59,80 @@ Respond ONLY with a valid JSON object in the following format (no markdown, no c
 - NOT_MATCH (<60): Poor fit, not recommended
 
 Be specific and reference actual content from both the resume and job description in your analysis.
+"""
+
+# Static instructions come first and the per-call job description and
+# resumes last, so consecutive match calls share the same prompt prefix and
+# can hit the provider's prefix (context) cache.
+_MATCH_PROMPT_PREFIX = f"""You are an expert HR recruiter and talent acquisition specialist. Your task is to evaluate whether a candidate's resume matches the requirements of a job description. The job description and the candidate's resume are given at the end of this prompt.
+
+# Your Task:
+Analyze the resume against the job description and provide a detailed evaluation.
+
+# Output Format:
+Respond ONLY with a valid JSON object in the following format (no markdown, no code blocks):
+
+{_MATCH_RESULT_SCHEMA}
+
+{_MATCH_GUIDELINES}"""
+
+_BATCH_MATCH_PROMPT_PREFIX = f"""You are an expert HR recruiter and talent acquisition specialist. Your task is to evaluate whether each of several candidates' resumes matches the requirements of a job description. The job description and the numbered candidate resumes are given at the end of this prompt.
+
+# Your Task:
+Analyze each resume against the job description and provide a detailed evaluation for every candidate. Evaluate each candidate independently; do not compare candidates with each other.
+
+# Output Format:
+Respond ONLY with a valid JSON array (no markdown, no code blocks) containing exactly one object per candidate, in candidate order. Each object has a "candidate" field with the candidate number, plus the fields of the following format:
+
+{_MATCH_RESULT_SCHEMA}
+
+{_MATCH_GUIDELINES}"""
+
+
+def generate_match_prompt(resume_content: str, jd_content: str) -> str:
+    """
+    Generate a prompt to evaluate if a resume matches a job description
+
+    Args:
+        resume_content: Merged content from all resume chunks
+        jd_content: Job description content
+
+    Returns:
+        Formatted prompt for the LLM
+    """
+    prompt = f"""{_MATCH_PROMPT_PREFIX}
+# Job Description:
+{jd_content}
+
+# Candidate Resume:
+{resume_content}
+"""
+    return prompt
+
+
+def generate_batch_match_prompt(resume_contents: List[str], jd_content: str) -> str:
+    """
+    Generate a prompt to evaluate several resumes against one job description
+
+    The job description and instructions are sent once for the whole batch
+    instead of once per resume.
+
+    Args:
+        resume_contents: Merged content of each resume, numbered from 1 in the prompt
+        jd_content: Job description content
+
+    Returns:
+        Formatted prompt for the LLM
+    """
+    candidates = "\n\n".join(
+        f"# Candidate {number} Resume:\n{resume_content}"
+        for number, resume_content in enumerate(resume_contents, start=1)
+    )
+
+    prompt = f"""{_BATCH_MATCH_PROMPT_PREFIX}
+# Job Description:
+{jd_content}
+
+{candidates}
 """
     return prompt
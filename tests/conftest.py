@@ -0,0 +1,130 @@
+"""
+Shared fakes and fixtures for the test suite
+
+Processors and the matcher are built through their constructors with the
+Gemini client factory patched, so tests exercise the same initialization
+as the app.
+"""
+
+import asyncio
+import json
+
+import pytest
+from google.api_core import exceptions as google_exceptions
+
+from config import Config
+from match import resume_jd_matcher
+from match.resume_jd_matcher import ResumeJDMatcher
+from process import jd_process, resume_process
+from process.jd_process import JDPreprocessor
+from process.resume_process import ResumePreprocessor
+from utils.cache_manager import create_text_cache
+
+# Prompt marker that identifies a batch match request
+_BATCH_PROMPT_MARKER = "# Candidate 1 Resume:"
+
+
+class FakeResponse:
+    """Minimal Gemini response"""
+
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeLLMClient:
+    """
+    Stand-in for the Gemini model
+
+    Returns payload as JSON (batch_payload for batch match prompts), records
+    every prompt, and fails the first quota_errors async calls with a quota
+    error. Like the real async gRPC client, async calls are bound to the
+    event loop of the first call and fail once that loop has closed.
+    """
+
+    def __init__(self, payload=None, batch_payload=None, quota_errors=0):
+        self.payload = payload if payload is not None else {}
+        self.batch_payload = batch_payload
+        self.quota_errors = quota_errors
+        self.prompts = []
+        self._loop = None
+
+    @property
+    def calls(self):
+        return len(self.prompts)
+
+    def _respond(self, contents):
+        if self.batch_payload is not None and isinstance(contents, str) and _BATCH_PROMPT_MARKER in contents:
+            return FakeResponse(json.dumps(self.batch_payload))
+        return FakeResponse(json.dumps(self.payload))
+
+    def generate_content(self, contents, **kwargs):
+        self.prompts.append(contents)
+        return self._respond(contents)
+
+    async def generate_content_async(self, contents, **kwargs):
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+        elif self._loop is not loop and self._loop.is_closed():
+            raise RuntimeError("Event loop is closed")
+
+        self.prompts.append(contents)
+        if self.calls <= self.quota_errors:
+            raise google_exceptions.ResourceExhausted("quota exceeded")
+        return self._respond(contents)
+
+
+@pytest.fixture
+def fake_llm(monkeypatch, tmp_path):
+    """
+    Fake Gemini client returned by every processor and matcher constructor
+
+    Disk caches created by the constructors are redirected to tmp_path.
+    """
+    client = FakeLLMClient()
+
+    def get_fake_model(api_key, model_name):
+        return client
+
+    for module in (jd_process, resume_process, resume_jd_matcher):
+        monkeypatch.setattr(module, 'get_generative_model', get_fake_model)
+    monkeypatch.setattr(Config, 'GOOGLE_API_KEY', 'test-key')
+    monkeypatch.setattr(Config, 'RESUME_CACHE_DIR', str(tmp_path / 'resume_extractions'))
+    monkeypatch.setattr(Config, 'MATCH_CACHE_DIR', str(tmp_path / 'match_results'))
+    return client
+
+
+@pytest.fixture
+def text_cache(tmp_path):
+    """JSON cache in a temporary directory"""
+    return create_text_cache(cache_dir=str(tmp_path))
+
+
+@pytest.fixture
+def jd_processor(fake_llm):
+    """JDPreprocessor with the fake LLM client and the parse cache enabled"""
+    return JDPreprocessor()
+
+
+@pytest.fixture
+def resume_processor(fake_llm):
+    """ResumePreprocessor with the fake LLM client and caching disabled"""
+    return ResumePreprocessor(enable_cache=False)
+
+
+@pytest.fixture
+def cached_resume_processor(fake_llm):
+    """ResumePreprocessor with the fake LLM client and caches under tmp_path"""
+    return ResumePreprocessor(enable_cache=True)
+
+
+@pytest.fixture
+def matcher(fake_llm):
+    """ResumeJDMatcher with the fake LLM client and caching disabled"""
+    return ResumeJDMatcher(enable_cache=False)
+
+
+@pytest.fixture
+def no_retry_delay(monkeypatch):
+    """Make quota backoff immediate"""
+    monkeypatch.setattr(Config, 'LLM_RETRY_BASE_DELAY', 0)
@@ -0,0 +1,261 @@
+"""
+Tests for the file-based cache manager
+"""
+
+import gc
+import os
+import threading
+import weakref
+
+import numpy as np
+import pytest
+from utils.cache_manager import (
+    CacheManager,
+    create_text_cache,
+    create_embedding_cache,
+    create_object_cache
+)
+
+
+class TestJsonCache:
+    """Test JSON-format caching"""
+
+    def test_round_trip(self, text_cache):
+        """Test that a stored dict is returned unchanged"""
+        value = {'name': 'Ann', 'skills': ['Go', 'Python'], 'years': 3.5}
+        text_cache.set("key", value)
+        assert text_cache.get("key") == value
+
+    def test_miss(self, text_cache):
+        """Test that an unknown key returns None"""
+        assert text_cache.get("missing") is None
+
+    def test_reads_indented_files(self, text_cache):
+        """Test that files written by older versions (indented JSON) still load"""
+        text_cache._get_cache_path("key").write_text('{\n  "a": 1\n}', encoding='utf-8')
+        assert text_cache.get("key") == {'a': 1}
+
+    def test_unserializable_value(self, text_cache):
+        """Test that a value that cannot be encoded is rejected without a file"""
+        assert text_cache.set("key", {'bad': object()}) is False
+        assert text_cache.get("key") is None
+
+
+class TestObjectCache:
+    """Test pickle-format caching"""
+
+    def test_round_trip(self, tmp_path):
+        """Test that arbitrary Python objects round-trip"""
+        cache = create_object_cache(cache_dir=str(tmp_path))
+        cache.set("key", {1, 2, 3})
+        assert cache.get("key") == {1, 2, 3}
+
+
+class TestRawBytes:
+    """Test the raw bytes API"""
+
+    def test_get_bytes_returns_file_contents(self, text_cache):
+        """Test that get_bytes returns the stored payload without decoding"""
+        text_cache.set_bytes("key", b'{"a":1}')
+        assert text_cache.get_bytes("key") == b'{"a":1}'
+        assert text_cache.get("key") == {'a': 1}
+
+    def test_cached_raw(self, text_cache):
+        """Test that the raw decorator stores and returns the function's bytes"""
+        calls = []
+
+        @text_cache.cached(raw=True)
+        def fetch(text):
+            calls.append(text)
+            return b'{"text":"' + text.encode() + b'"}'
+
+        assert fetch("hi") == b'{"text":"hi"}'
+        assert fetch("hi") == b'{"text":"hi"}'
+        assert calls == ["hi"]
+
+    def test_cached_key_distinguishes_types(self, text_cache):
+        """Test that equal-looking arguments of different types are cached separately"""
+        @text_cache.cached()
+        def echo(value, scale=1):
+            return {'value': value}
+
+        assert echo(1) == {'value': 1}
+        assert echo("1") == {'value': "1"}
+        assert echo(1, scale=2) == {'value': 1}
+
+    def test_cached_key_separates_args_from_kwargs(self, text_cache):
+        """Test that positional values are not confused with keyword name/value pairs"""
+        @text_cache.cached()
+        def lookup(*args, **kwargs):
+            return {'args': list(args), 'kwargs': kwargs}
+
+        assert lookup("lang", "en") == {'args': ["lang", "en"], 'kwargs': {}}
+        assert lookup(lang="en") == {'args': [], 'kwargs': {'lang': "en"}}
+
+
+class TestCacheKeys:
+    """Test cache key hashing"""
+
+    def test_bytes_key_matches_str_key(self, text_cache):
+        """Test that a pre-encoded key addresses the same entry as its str form"""
+        text_cache.set("prompt é", {'a': 1})
+        assert text_cache.get("prompt é".encode()) == {'a': 1}
+        assert text_cache.get(memoryview("prompt é".encode())) == {'a': 1}
+
+
+class TestExpiryAndDelete:
+    """Test TTL checks and deletion"""
+
+    def test_expired_entry(self, tmp_path):
+        """Test that entries older than max_age_days are ignored"""
+        cache = create_text_cache(cache_dir=str(tmp_path))
+        cache.set("key", {'a': 1})
+        path = cache._get_cache_path("key")
+        old = path.stat().st_mtime - 2 * 86400
+        os.utime(path, (old, old))
+        cache._mem.clear()  # force a read from disk
+        assert cache.get("key", max_age_days=1) is None
+        assert cache.get("key", max_age_days=3) == {'a': 1}
+        # The memory tier keeps the file's mtime, so it expires the same way
+        assert cache.get("key", max_age_days=1) is None
+
+    def test_delete(self, text_cache):
+        """Test that delete reports whether an entry existed"""
+        text_cache.set("key", {'a': 1})
+        assert text_cache.delete("key") is True
+        assert text_cache.delete("key") is False
+        assert text_cache.get("key") is None
+
+
+class TestMemoryTier:
+    """Test the in-memory LRU tier"""
+
+    def test_hit_skips_disk(self, text_cache):
+        """Test that a recently set entry is served without reading its file"""
+        text_cache.set("key", {'a': 1})
+        text_cache._get_cache_path("key").unlink()
+        assert text_cache.get("key") == {'a': 1}
+
+    def test_returns_independent_copies(self, text_cache):
+        """Test that mutating a returned value does not change the cache"""
+        text_cache.set("key", {'a': [1]})
+        text_cache.get("key")['a'].append(2)
+        assert text_cache.get("key") == {'a': [1]}
+
+    def test_clear_through_other_instance(self, tmp_path):
+        """Test that clear_all() on a second instance also empties the first one's memory tier"""
+        cache = create_text_cache(cache_dir=str(tmp_path))
+        cache.set("key", {'a': 1})
+        assert cache.get("key") == {'a': 1}
+
+        create_text_cache(cache_dir=str(tmp_path)).clear_all()
+        assert cache.get("key") is None
+
+    def test_delete_through_other_instance(self, tmp_path):
+        """Test that a delete through another instance on the same store is seen"""
+        cache = create_text_cache(cache_dir=str(tmp_path))
+        cache.set("key", {'a': 1})
+        create_text_cache(cache_dir=str(tmp_path)).delete("key")
+        assert cache.get("key") is None
+
+    def test_lru_eviction(self, tmp_path):
+        """Test that the least recently used entry is evicted at capacity"""
+        cache = CacheManager(cache_dir=str(tmp_path), mem_cap=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert list(cache._mem) == [cache._get_cache_key(k) for k in ("a", "c")]
+
+
+class TestSqliteBackend:
+    """Test the single-file SQLite backend"""
+
+    @pytest.fixture
+    def sqlite_cache(self, tmp_path):
+        return create_text_cache(cache_dir=str(tmp_path), backend="sqlite")
+
+    def test_round_trip_across_instances(self, sqlite_cache, tmp_path):
+        """Test that entries persist in the database, not in per-key files"""
+        sqlite_cache.set("key", {'a': [1, 2]})
+        reopened = create_text_cache(cache_dir=str(tmp_path), backend="sqlite")
+        assert reopened.get("key") == {'a': [1, 2]}
+        assert not sqlite_cache._get_cache_path("key").exists()
+
+    def test_expired_entry(self, sqlite_cache, tmp_path):
+        """Test that the stored mtime is used for TTL checks"""
+        sqlite_cache.set("key", {'a': 1})
+        sqlite_cache._db.execute("UPDATE entries SET mtime = mtime - ?", (2 * 86400,))
+        sqlite_cache._mem.clear()  # force a read from the database
+        reopened = create_text_cache(cache_dir=str(tmp_path), backend="sqlite")
+        assert reopened.get("key", max_age_days=1) is None
+        assert reopened.get("key", max_age_days=3) == {'a': 1}
+
+    def test_delete_clear_and_stats(self, sqlite_cache):
+        """Test delete, clear_all and get_stats against the database"""
+        sqlite_cache.set("a", 1)
+        sqlite_cache.set("b", 2)
+        assert sqlite_cache.delete("a") is True
+        assert sqlite_cache.delete("a") is False
+        assert sqlite_cache.get_stats()["total_files"] == 1
+        assert sqlite_cache.clear_all() == 1
+        assert sqlite_cache.get("b") is None
+
+    def test_unknown_backend(self, tmp_path):
+        """Test that an unsupported backend is rejected"""
+        with pytest.raises(ValueError):
+            CacheManager(cache_dir=str(tmp_path), backend="lmdb")
+
+
+class TestBackgroundWrites:
+    """Test queued cache writes"""
+
+    def test_visible_before_and_after_flush(self, tmp_path):
+        """Test that queued values are readable immediately and on disk after flush"""
+        cache = create_text_cache(cache_dir=str(tmp_path), background_writes=True)
+        value = {'a': [1]}
+        cache.set("key", value)
+        value['a'].append(2)  # serialized at set() time, so this is not cached
+        assert cache.get("key") == {'a': [1]}
+
+        cache.flush()
+        cache._mem.clear()  # force a read from disk
+        assert create_text_cache(cache_dir=str(tmp_path)).get("key") == {'a': [1]}
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_writer_shared_and_instances_released(self, tmp_path):
+        """Test that caches share one writer thread and are not kept alive by it"""
+        caches = [
+            create_text_cache(cache_dir=str(tmp_path / str(i)), background_writes=True)
+            for i in range(3)
+        ]
+        for cache in caches:
+            cache.set("key", {'a': 1})
+        caches[0].flush()
+
+        writers = [t for t in threading.enumerate() if t.name == "cache-writer"]
+        assert len(writers) == 1
+
+        ref = weakref.ref(caches[0])
+        del caches, cache
+        gc.collect()
+        assert ref() is None
+
+
+class TestEmbeddingCache:
+    """Test raw array storage"""
+
+    def test_round_trip(self, tmp_path):
+        """Test that vectors come back as arrays of the configured dtype"""
+        cache = create_embedding_cache(cache_dir=str(tmp_path), dtype="float32")
+        cache.set("key", [[0.25, -1.5], [3.0, 0.125]])
+        result = cache.get("key")
+        assert result.dtype == np.float32
+        assert result.tolist() == [[0.25, -1.5], [3.0, 0.125]]
+
+    def test_float16_halves_size(self, tmp_path):
+        """Test that float16 storage uses two bytes per element plus the header"""
+        cache = create_embedding_cache(cache_dir=str(tmp_path))
+        cache.set("key", np.ones(1536, dtype=np.float32))
+        assert len(cache.get_bytes("key")) < 1536 * 2 + 256
+        assert cache.get("key").dtype == np.float16
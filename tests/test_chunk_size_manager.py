@@ -0,0 +1,88 @@
+"""
+Tests for chunk size management
+"""
+
+from utils.chunk_size_manager import ChunkSizeManager, validate_and_split_chunks
+
+
+def make_chunk(content, chunk_id="r1_summary"):
+    """Chunk dict in the shape produced by the preprocessors"""
+    return {'chunk_id': chunk_id, 'field': 'summary', 'content': content, 'metadata': {'field': 'summary'}}
+
+
+class TestEstimateTokens:
+    """Test token estimation"""
+
+    def test_word_count(self):
+        """Test that tokens are estimated as whitespace-separated words"""
+        assert ChunkSizeManager.estimate_tokens("one two  three\nfour") == 4
+
+    def test_empty(self):
+        """Test empty text has no tokens"""
+        assert ChunkSizeManager.estimate_tokens("") == 0
+
+
+class TestSplitOversizedChunk:
+    """Test splitting of oversized chunks"""
+
+    def test_small_chunk_unchanged(self):
+        """Test that a chunk within limits is returned as-is"""
+        chunk = make_chunk("Short summary.")
+        assert ChunkSizeManager.split_oversized_chunk(chunk) == [chunk]
+
+    def test_large_chunk_split(self):
+        """Test that a large chunk is split into numbered parts within the limit"""
+        chunk = make_chunk("Built data pipelines in Python. " * 200)
+        parts = ChunkSizeManager.split_oversized_chunk(chunk)
+
+        assert len(parts) > 1
+        assert [p['chunk_id'] for p in parts] == [f"r1_summary_part{i}" for i in range(len(parts))]
+        assert all(ChunkSizeManager.estimate_tokens(p['content']) <= ChunkSizeManager.MAX_TOKENS for p in parts)
+        assert parts[0]['metadata']['total_parts'] == len(parts)
+
+
+class TestValidateAndSplitChunks:
+    """Test the batch entry point"""
+
+    def test_only_oversized_chunks_split(self):
+        """Test that normal chunks pass through and oversized ones are split"""
+        small = make_chunk("Python developer.", "r1_skills")
+        large = make_chunk("Led a team of engineers. " * 200, "r1_summary")
+        result = validate_and_split_chunks([small, large])
+
+        assert result[0] is small
+        assert all(c['chunk_id'].startswith("r1_summary_part") for c in result[1:])
+
+
+class TestGetStatistics:
+    """Test chunk size statistics"""
+
+    def test_counts(self):
+        """Test aggregate counts over chunks of different sizes"""
+        chunks = [make_chunk("word " * n, f"c{n}") for n in (10, 100, 300, 600)]
+        stats = ChunkSizeManager.get_statistics(chunks)
+
+        assert stats['avg_tokens'] == 252
+        assert (stats['min_tokens'], stats['max_tokens']) == (10, 600)
+        assert (stats['undersized_count'], stats['optimal_count'], stats['oversized_count']) == (1, 1, 1)
+        assert type(stats['max_tokens']) is int
+
+
+class TestSplitInHalf:
+    """Test the fast path for mildly oversized chunks"""
+
+    def test_halved_at_sentence_boundary(self):
+        """Test that a chunk just over the limit becomes two whole-sentence halves"""
+        text = "Designed REST services for payments. " * 100
+        text += "Mentored junior engineers on testing. " * 10
+        parts = ChunkSizeManager.split_oversized_chunk(make_chunk(text))
+
+        assert len(parts) == 2
+        assert all(p['content'].endswith('.') for p in parts)
+        assert " ".join(p['content'] for p in parts) == text.strip()
+
+    def test_no_boundary_falls_back(self):
+        """Test that text without sentence boundaries uses the clause splitter"""
+        text = ", ".join(["word"] * 600)
+        parts = ChunkSizeManager.split_oversized_chunk(make_chunk(text))
+        assert all(ChunkSizeManager.estimate_tokens(p['content']) <= ChunkSizeManager.MAX_TOKENS for p in parts)
@@ -0,0 +1,140 @@
+"""
+Tests for job description processing
+"""
+
+import pytest
+from process.jd_process import coerce_jd_schema
+
+
+@pytest.fixture
+def cached_jd_processor(jd_processor, fake_llm):
+    """JDPreprocessor whose fake LLM client extracts a title"""
+    fake_llm.payload = {'title': 'Engineer'}
+    return jd_processor
+
+
+class TestCoerceJdSchema:
+    """Test JD schema validation"""
+
+    def test_missing_fields_get_defaults(self):
+        """Test that missing fields are filled with empty values"""
+        jd = coerce_jd_schema({})
+        assert jd['title'] == ''
+        assert jd['skills'] == {'technical': [], 'soft': []}
+        assert jd['experience'] == []
+        assert jd['responsibilities'] == []
+
+    def test_string_list_field_coerced(self):
+        """Test that a string in a list field becomes a one-item list"""
+        jd = coerce_jd_schema({'certifications': 'AWS'})
+        assert jd['certifications'] == ['AWS']
+
+    def test_invalid_skills_type(self):
+        """Test that non-dict skills are treated as empty"""
+        jd = coerce_jd_schema({'skills': ['Python']})
+        assert jd['skills'] == {'technical': [], 'soft': []}
+
+    def test_non_dict_entries_dropped(self):
+        """Test that non-dict experience entries are ignored"""
+        jd = coerce_jd_schema({'experience': ['3 years', {'level': 'Senior'}]})
+        assert jd['experience'] == [{'level': 'Senior'}]
+
+
+class TestGenerateHybridChunks:
+    """Test JD chunk generation"""
+
+    def test_chunk_ids_and_fields(self, jd_processor):
+        """Test chunk IDs and fields for a typical JD"""
+        jd_json = {
+            'title': 'Engineer',
+            'skills': {'technical': ['Python', 'SQL'], 'soft': ['Communication']},
+            'experience': [{'years_required': '3+', 'level': 'Mid'}],
+            'responsibilities': ['Build APIs', 'Review code']
+        }
+        chunks = jd_processor.generate_hybrid_chunks(jd_json, 'jd_1')
+        ids = [chunk['chunk_id'] for chunk in chunks]
+        assert ids == ['jd_1_skills', 'jd_1_0_experience', 'jd_1_responsibilities', 'jd_1_additional_info']
+
+    def test_skills_content(self, jd_processor):
+        """Test skills chunk formatting"""
+        jd_json = {'skills': {'technical': ['Python', 'SQL'], 'soft': ['Communication']}}
+        chunks = jd_processor.generate_hybrid_chunks(jd_json, 'jd_1')
+        assert chunks[0]['content'] == "Technical Skills: Python, SQL | Soft Skills: Communication"
+
+    def test_responsibilities_bullets(self, jd_processor):
+        """Test responsibilities are rendered as a bulleted list"""
+        chunks = jd_processor.generate_hybrid_chunks({'responsibilities': ['A', 'B']}, 'jd_1')
+        assert chunks[0]['content'] == "Key Responsibilities:\n- A\n- B"
+
+    def test_prebulleted_responsibilities(self, jd_processor):
+        """Test responsibilities the LLM already bulleted are not bulleted again"""
+        chunks = jd_processor.generate_hybrid_chunks({'responsibilities': ['- A', '- B']}, 'jd_1')
+        assert chunks[0]['content'] == "Key Responsibilities:\n- A\n- B"
+
+    def test_mixed_bulleted_responsibilities(self, jd_processor):
+        """Test that bullets are decided per item, and markdown bold is not a bullet"""
+        jd_json = {'responsibilities': ['A', '• B', '**Lead** the team', '* C']}
+        chunks = jd_processor.generate_hybrid_chunks(jd_json, 'jd_1')
+        assert chunks[0]['content'] == "Key Responsibilities:\n- A\n• B\n- **Lead** the team\n* C"
+
+    def test_metadata(self, jd_processor):
+        """Test chunk metadata"""
+        chunks = jd_processor.generate_hybrid_chunks({'certifications': ['AWS']}, 'jd_1')
+        assert chunks[0]['metadata'] == {
+            'document_id': 'jd_1',
+            'document_type': 'job_description',
+            'field': 'certifications'
+        }
+
+    def test_empty_jd(self, jd_processor):
+        """Test that an empty JD produces no chunks"""
+        assert jd_processor.generate_hybrid_chunks({}, 'jd_1') == []
+
+
+class TestPreprocessJdBatch:
+    """Test synchronous batch preprocessing"""
+
+    def test_mismatched_lengths(self, jd_processor):
+        """Test that texts and IDs must pair up"""
+        with pytest.raises(ValueError):
+            jd_processor.preprocess_jd_batch(['JD one', 'JD two'], ['jd_1'])
+
+    def test_repeated_batches_reuse_event_loop(self, jd_processor, fake_llm):
+        """Test that a second batch works with the loop-bound async client (e.g. a Streamlit rerun)"""
+        fake_llm.payload = {'certifications': ['AWS']}
+        first = jd_processor.preprocess_jd_batch(['JD one'], ['jd_1'])
+        second = jd_processor.preprocess_jd_batch(['JD two', 'JD three'], ['jd_2', 'jd_3'])
+
+        assert [chunks[0]['chunk_id'] for chunks in first + second] == [
+            'jd_1_certifications', 'jd_2_certifications', 'jd_3_certifications'
+        ]
+        assert fake_llm.calls == 3
+
+
+class TestParseCache:
+    """Test the in-memory JD parse cache"""
+
+    def test_repeat_text_skips_llm(self, cached_jd_processor):
+        """Test that parsing the same JD twice calls the LLM once"""
+        first = cached_jd_processor.parse_with_llm("Senior engineer wanted")
+        second = cached_jd_processor.parse_with_llm("Senior engineer wanted")
+        assert first == second
+        assert cached_jd_processor.llm_client.calls == 1
+
+    def test_cached_result_is_a_copy(self, cached_jd_processor):
+        """Test that mutating a returned result does not alter the cache"""
+        cached_jd_processor.parse_with_llm("JD")['title'] = 'changed'
+        assert cached_jd_processor.parse_with_llm("JD")['title'] == 'Engineer'
+
+    def test_cached_nested_lists_are_copied(self, cached_jd_processor, fake_llm):
+        """Test that mutating a nested list in a returned result does not alter the cache"""
+        fake_llm.payload = {'title': 'Engineer', 'skills': ['Python']}
+        cached_jd_processor.parse_with_llm("JD")['skills'].append('Go')
+        assert cached_jd_processor.parse_with_llm("JD")['skills'] == ['Python']
+
+    def test_disabled_cache(self, cached_jd_processor):
+        """Test that every call hits the LLM when caching is disabled"""
+        cached_jd_processor.enable_cache = False
+        cached_jd_processor.parse_with_llm("JD")
+        cached_jd_processor.parse_with_llm("JD")
+        assert cached_jd_processor.llm_client.calls == 2
@@ -0,0 +1,41 @@
+"""
+Tests for logging formatters
+"""
+
+import logging
+
+from utils.logger import ColoredFormatter
+
+GREEN = ColoredFormatter.COLORS['INFO']
+RESET = ColoredFormatter.COLORS['RESET']
+
+
+def make_record(level=logging.INFO, msg="hello"):
+    """Log record as emitted by a module logger"""
+    return logging.LogRecord('test', level, __file__, 1, msg, None, None)
+
+
+class TestColoredFormatter:
+    """Test colored console formatting"""
+
+    def test_plain_levelname(self):
+        """Test that the level name is wrapped in its color"""
+        formatter = ColoredFormatter('%(levelname)s - %(message)s')
+        assert formatter.format(make_record()) == f"{GREEN}INFO{RESET} - hello"
+
+    def test_padded_levelname_keeps_flags(self):
+        """Test that width and alignment flags on levelname are preserved"""
+        formatter = ColoredFormatter('%(levelname)-8s|%(message)s')
+        expected = f"{GREEN}INFO{RESET}".ljust(8) + "|hello"
+        assert formatter.format(make_record()) == expected
+
+    def test_brace_style(self):
+        """Test that {-style formats are colored too"""
+        formatter = ColoredFormatter('{levelname} - {message}', style='{')
+        assert formatter.format(make_record()) == f"{GREEN}INFO{RESET} - hello"
+
+    def test_record_levelname_restored(self):
+        """Test that formatting leaves the record's levelname unchanged"""
+        record = make_record()
+        ColoredFormatter('{levelname}', style='{').format(record)
+        assert record.levelname == 'INFO'
@@ -0,0 +1,108 @@
+"""
+Tests for resume-JD matching
+"""
+
+import pytest
+
+from config import Config
+from match.resume_jd_matcher import ResumeJDMatcher
+
+
+def resume(name):
+    """Resume chunks with a single summary chunk"""
+    return (name, [{'chunk_id': f'{name}_summary', 'content': name, 'metadata': {'field': 'summary'}}])
+
+
+JD_CHUNKS = [{'chunk_id': 'jd_1_skills', 'content': 'Python', 'metadata': {'field': 'skills'}}]
+
+
+class TestBatchMatchResumes:
+    """Test precise matching of several resumes per LLM call"""
+
+    def test_one_call_per_batch(self, matcher, fake_llm, monkeypatch):
+        """Test that a batch response is mapped back to resumes by candidate number"""
+        monkeypatch.setattr(Config, 'MATCH_BATCH_SIZE', 5)
+        fake_llm.batch_payload = [
+            {'candidate': 2, 'match_score': 90},
+            {'candidate': 1, 'match_score': 70}
+        ]
+        results = matcher.batch_match_resumes([resume('r1'), resume('r2')], JD_CHUNKS)
+
+        assert len(fake_llm.prompts) == 1
+        assert [(r['resume_id'], r['match_score']) for r in results] == [('r2', 90), ('r1', 70)]
+        assert 'candidate' not in results[0]
+
+    def test_missing_candidates_fall_back(self, matcher, fake_llm, monkeypatch):
+        """Test that resumes missing from the batch response are matched individually"""
+        monkeypatch.setattr(Config, 'MATCH_BATCH_SIZE', 5)
+        fake_llm.payload = {'match_score': 50, 'qualified': False}
+        fake_llm.batch_payload = [{'candidate': 1, 'match_score': 70}]
+        results = matcher.batch_match_resumes([resume('r1'), resume('r2')], JD_CHUNKS)
+
+        assert len(fake_llm.prompts) == 2
+        assert {r['resume_id']: r['match_score'] for r in results} == {'r1': 70, 'r2': 50}
+
+    def test_batch_size_one(self, matcher, fake_llm, monkeypatch):
+        """Test that MATCH_BATCH_SIZE = 1 keeps one call per resume"""
+        monkeypatch.setattr(Config, 'MATCH_BATCH_SIZE', 1)
+        fake_llm.payload = {'match_score': 50, 'qualified': False}
+        matcher.batch_match_resumes([resume('r1'), resume('r2')], JD_CHUNKS)
+        assert len(fake_llm.prompts) == 2
+
+
+@pytest.fixture
+def cached_matcher(fake_llm):
+    """ResumeJDMatcher with the fake LLM client and the match cache under tmp_path"""
+    fake_llm.payload = {'match_score': 80, 'qualified': True}
+    return ResumeJDMatcher(enable_cache=True)
+
+
+class TestMatchCache:
+    """Test caching of match results"""
+
+    def test_repeat_match_skips_llm(self, cached_matcher, fake_llm):
+        """Test that matching the same resume and JD twice calls the LLM once"""
+        _, chunks = resume('r1')
+        first = cached_matcher.match_resume_with_jd(chunks, JD_CHUNKS, 'r1')
+        second = cached_matcher.match_resume_with_jd(chunks, JD_CHUNKS, 'r1')
+
+        assert first == second == {'match_score': 80, 'qualified': True}
+        assert fake_llm.calls == 1
+
+    def test_same_id_new_content_misses(self, cached_matcher, fake_llm):
+        """Test that a re-uploaded resume reusing an ID is not served the old result"""
+        cached_matcher.match_resume_with_jd(resume('r1')[1], JD_CHUNKS, 'ann_smith')
+        fake_llm.payload = {'match_score': 40, 'qualified': False}
+        result = cached_matcher.match_resume_with_jd(resume('r2')[1], JD_CHUNKS, 'ann_smith')
+
+        assert result['match_score'] == 40
+        assert fake_llm.calls == 2
+
+
+class TestMergeCache:
+    """Test caching of merged resume and JD text"""
+
+    def test_field_change_rebuilds_merge(self, matcher):
+        """Test that chunks differing only in field are not served a stale merge"""
+        chunks = [{'chunk_id': 'c1', 'content': 'Python', 'metadata': {'field': 'skills'}}]
+        moved = [{'chunk_id': 'c1', 'content': 'Python', 'metadata': {'field': 'projects'}}]
+
+        assert '## SKILLS' in matcher.merge_resume_chunks(chunks)
+        assert '## PROJECTS' in matcher.merge_resume_chunks(moved)
+
+    def test_same_id_new_content_rebuilds_merge(self, matcher):
+        """Test that a resume ID reused for new content is merged again"""
+        first = matcher.merge_resume_chunks(resume('r1')[1], 'ann_smith')
+        second = matcher.merge_resume_chunks(resume('r2')[1], 'ann_smith')
+
+        assert 'r1' in first
+        assert 'r2' in second
+
+    def test_cache_is_bounded(self, matcher, monkeypatch):
+        """Test that the oldest merges are evicted beyond the size limit"""
+        monkeypatch.setattr(Config, 'MERGE_CACHE_MAX_SIZE', 2)
+        for name in ('r1', 'r2', 'r3'):
+            matcher.merge_resume_chunks(resume(name)[1], name)
+
+        assert len(matcher._merge_cache) == 2
+        assert not any(key.startswith('r1:') for key in matcher._merge_cache)
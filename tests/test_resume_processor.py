@@ -0,0 +1,175 @@
+"""
+Tests for resume processing
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from config import Config
+from process import resume_process
+from utils.exceptions import PDFExtractionError
+
+
+class TestGenerateResumeChunks:
+    """Test resume chunk generation"""
+
+    def test_chunk_ids_and_fields(self, resume_processor):
+        """Test chunk ids follow the <resume_id>[_<index>]_<field> scheme"""
+        resume = {
+            'skills': ['Python'],
+            'experience': [{'role': 'Dev', 'company': 'Acme'}],
+            'projects': [{'name': 'Bot', 'description': 'Chat bot'}]
+        }
+        chunks = resume_processor.generate_resume_chunks(resume, 'r1')
+        assert [c['chunk_id'] for c in chunks] == ['r1_skills', 'r1_0_experience', 'r1_0_projects']
+
+    def test_experience_content(self, resume_processor):
+        """Test optional experience parts are included when present"""
+        resume = {'experience': [{'role': 'Dev', 'company': 'Acme', 'period': '2020'}]}
+        chunks = resume_processor.generate_resume_chunks(resume, 'r1')
+        assert chunks[0]['content'] == "Role: Dev | Company: Acme | Period: 2020"
+
+
+class TestPreprocessResumes:
+    """Test concurrent resume preprocessing"""
+
+    def test_results_in_input_order(self, resume_processor, fake_llm):
+        """Test that batch results line up with the input items"""
+        fake_llm.payload = {'name': 'Ann', 'skills': ['Go']}
+        results = asyncio.run(resume_processor.preprocess_resumes([
+            ("resume one", "r1", False),
+            ("resume two", "r2", False)
+        ]))
+        assert [chunks[0]['chunk_id'] for chunks, _ in results] == ['r1_skills', 'r2_skills']
+
+    def test_identical_inflight_requests_coalesced(self, resume_processor, fake_llm):
+        """Test that concurrent identical resumes share one LLM call"""
+        fake_llm.payload = {'name': 'Ann', 'skills': ['Go']}
+        results = asyncio.run(resume_processor.preprocess_resumes([
+            ("same resume", "r1", False),
+            ("same resume", "r2", False)
+        ]))
+        assert fake_llm.calls == 1
+        assert [chunks[0]['chunk_id'] for chunks, _ in results] == ['r1_skills', 'r2_skills']
+
+    def test_cancelled_waiter_does_not_cancel_shared_call(self, resume_processor, fake_llm, monkeypatch):
+        """Test that cancelling the first waiter leaves the shared call running for the others"""
+        fake_llm.payload = {'name': 'Ann'}
+        respond = fake_llm.generate_content_async
+
+        async def slow_response(contents, **kwargs):
+            await asyncio.sleep(0.01)
+            return await respond(contents, **kwargs)
+        monkeypatch.setattr(fake_llm, 'generate_content_async', slow_response)
+
+        async def run():
+            first = asyncio.create_task(resume_processor.parse_with_llm_async("same resume"))
+            second = asyncio.create_task(resume_processor.parse_with_llm_async("same resume"))
+            await asyncio.sleep(0)
+            first.cancel()
+            data = await second
+            await asyncio.sleep(0)
+            return first.cancelled(), data
+
+        first_cancelled, data = asyncio.run(run())
+        assert first_cancelled
+        assert data['name'] == 'Ann'
+        assert fake_llm.calls == 1
+        assert resume_processor._inflight == {}
+
+    def test_quota_errors_retried(self, resume_processor, fake_llm, no_retry_delay):
+        """Test that quota errors are retried with backoff"""
+        fake_llm.payload = {'name': 'Ann'}
+        fake_llm.quota_errors = 2
+        data = asyncio.run(resume_processor.parse_with_llm_async("resume text"))
+        assert data['name'] == 'Ann'
+        assert fake_llm.calls == 3
+
+
+class TestResponseCache:
+    """Test caching of parsed resumes"""
+
+    def test_cached_after_background_write(self, cached_resume_processor, fake_llm):
+        """Test that a parsed resume is written in the background and reused"""
+        fake_llm.payload = {'name': 'Ann'}
+
+        asyncio.run(cached_resume_processor.parse_with_llm_async("resume text"))
+        cached_resume_processor.cache.flush()
+        cached_resume_processor.cache._mem.clear()  # force a read from disk
+        data = asyncio.run(cached_resume_processor.parse_with_llm_async("resume text"))
+
+        assert data['name'] == 'Ann'
+        assert fake_llm.calls == 1
+
+
+class FakeGenai:
+    """Stand-in for the genai file API that records uploads and deletions"""
+
+    def __init__(self, state="ACTIVE"):
+        self.state = state
+        self.uploads = 0
+        self.deleted = []
+
+    def _file(self, name):
+        return SimpleNamespace(name=name, uri=f"https://files/{name}", state=SimpleNamespace(name=self.state))
+
+    def upload_file(self, path, **kwargs):
+        self.uploads += 1
+        return self._file(f"files/{self.uploads}")
+
+    def get_file(self, name):
+        return self._file(name)
+
+    def delete_file(self, name):
+        self.deleted.append(name)
+
+
+@pytest.fixture
+def fake_genai(monkeypatch):
+    """Fake genai file API with files that are ready immediately"""
+    fake = FakeGenai()
+    monkeypatch.setattr(resume_process, 'genai', fake)
+    return fake
+
+
+class TestUploadedPdfCleanup:
+    """Test deletion of uploaded resume PDFs"""
+
+    def test_deleted_after_parse_with_cache_enabled(self, cached_resume_processor, fake_llm, fake_genai):
+        """Test that the upload is deleted once the resume is parsed, even when caching"""
+        fake_llm.payload = {'name': 'Ann'}
+        data = cached_resume_processor.parse_with_llm(b"%PDF-1.4", is_pdf=True)
+        assert data['name'] == 'Ann'
+        assert fake_genai.deleted == ["files/1"]
+
+    def test_deleted_after_async_parse(self, cached_resume_processor, fake_llm, fake_genai):
+        """Test that the async path deletes the upload too"""
+        fake_llm.payload = {'name': 'Ann'}
+        asyncio.run(cached_resume_processor.parse_with_llm_async(b"%PDF-1.4", is_pdf=True))
+        assert fake_genai.deleted == ["files/1"]
+
+    def test_deleted_when_generation_fails(self, resume_processor, fake_llm, fake_genai, monkeypatch):
+        """Test that the upload is deleted when the LLM call raises"""
+        def fail(contents, **kwargs):
+            raise RuntimeError("boom")
+        monkeypatch.setattr(fake_llm, 'generate_content', fail)
+
+        with pytest.raises(PDFExtractionError):
+            resume_processor.parse_with_llm(b"%PDF-1.4", is_pdf=True)
+        assert fake_genai.deleted == ["files/1"]
+
+
+class TestPdfProcessingWait:
+    """Test waiting for Gemini to process an uploaded PDF"""
+
+    def test_timeout(self, resume_processor, monkeypatch):
+        """Test that a file stuck in PROCESSING raises after the deadline and is deleted"""
+        fake = FakeGenai(state="PROCESSING")
+        monkeypatch.setattr(resume_process, 'genai', fake)
+        monkeypatch.setattr(Config, 'PDF_UPLOAD_TIMEOUT_SECONDS', 0.05)
+        monkeypatch.setattr(Config, 'PDF_POLL_INITIAL_DELAY', 0.01)
+        with pytest.raises(PDFExtractionError):
+            resume_processor._upload_pdf(b"%PDF-1.4", "key")
+        assert fake.deleted == ["files/1"]
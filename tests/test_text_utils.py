@@ -2,12 +2,16 @@
 Tests for text utility functions
 """
 
+import json
+
 import pytest
 from utils.text_utils import (
     normalize_text,
     clean_name_for_id,
     truncate_text,
     extract_json_from_text,
+    find_json_object,
+    parse_json,
     format_list_as_string
 )
 
@@ -42,6 +46,10 @@ class TestNormalizeText:
         assert normalize_text("") == ""
         assert normalize_text(None) == ""
 
+    def test_stray_angle_brackets(self):
+        """Test that '<' with no closing '>' after it is kept"""
+        assert normalize_text("<i>x</i> if a < b and c < d") == "x if a < b and c < d"
+
 
 class TestCleanNameForId:
     """Test name cleaning for ID generation"""
@@ -113,6 +121,47 @@ class TestExtractJsonFromText:
         result = extract_json_from_text(text)
         assert result is None
 
+    def test_trailing_braces_ignored(self):
+        """Test that prose with braces after the object is not included"""
+        text = 'Result: {"key": {"nested": 1}} and {not json}'
+        result = extract_json_from_text(text)
+        assert result == '{"key": {"nested": 1}}'
+
+
+class TestFindJsonObject:
+    """Test balanced-brace JSON object scanning"""
+
+    def test_braces_inside_strings(self):
+        """Test that braces inside string literals do not affect depth"""
+        text = '{"a": "}{", "b": {"c": "{"}} tail'
+        assert find_json_object(text) == '{"a": "}{", "b": {"c": "{"}}'
+
+    def test_escaped_quotes(self):
+        """Test that escaped quotes do not end a string literal"""
+        text = r'{"a": "say \"}\" now"} tail'
+        assert find_json_object(text) == r'{"a": "say \"}\" now"}'
+
+    def test_unbalanced_falls_back_to_last_brace(self):
+        """Test truncated objects fall back to first '{' through last '}'"""
+        assert find_json_object('{"a": {"b": 1}') == '{"a": {"b": 1}'
+
+    def test_no_object(self):
+        """Test text without an opening brace"""
+        assert find_json_object("no braces") is None
+
+
+class TestParseJson:
+    """Test JSON parsing"""
+
+    def test_valid_object(self):
+        """Test parsing a JSON object"""
+        assert parse_json('{"a": [1, "b"], "c": null}') == {'a': [1, 'b'], 'c': None}
+
+    def test_invalid_raises_decode_error(self):
+        """Test invalid JSON raises json.JSONDecodeError"""
+        with pytest.raises(json.JSONDecodeError):
+            parse_json('{"a": }')
+
 
 class TestFormatListAsString:
     """Test list formatting"""
@@ -140,3 +189,7 @@ class TestFormatListAsString:
         items = ['x', 'y']
         result = format_list_as_string(items, separator=" | ")
         assert result == "x | y"
+
+    def test_non_string_items(self):
+        """Test that non-string items are converted with str()"""
+        assert format_list_as_string([1, 'a', 2.5], max_items=2) == "1, a ... (+1 more)"
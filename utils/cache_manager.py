@@ -1,17 +1,145 @@
+import atexit
 import hashlib
+import io
 import json
+import os
 import pickle
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from itertools import chain
 from pathlib import Path
-from typing import Optional, Any, Callable
-from datetime import datetime, timedelta
+from typing import Optional, Any, Callable, Dict, Tuple, Union
 import logging
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
+
+try:
+    from xxhash import xxh3_128 as _new_hasher, xxh3_128_hexdigest as _hexdigest
+except ImportError:
+    # xxhash is optional. Without it, _get_cache_key hashes with MD5 and
+    # _make_call_key's _new_hasher streams through blake2b
+    def _hexdigest(data: bytes) -> str:
+        return hashlib.md5(data).hexdigest()
+
+    def _new_hasher():
+        return hashlib.blake2b(digest_size=16)
+
 logger = logging.getLogger(__name__)
 
+# Keys may be passed pre-encoded to skip the UTF-8 copy of large prompts
+CacheKey = Union[str, bytes, bytearray, memoryview]
+
+
+# Sentinel between positional and keyword arguments in _make_call_key
+_KWARGS_MARKER = object()
+
+
+def _make_call_key(func_name: str, args: tuple, kwargs: dict) -> str:
+    """
+    Hash a function call's arguments into a cache key.
+
+    Arguments are fed to a streaming hasher one at a time, so a large str or
+    bytes argument is hashed in place instead of being copied into a
+    str(args) repr first. Each part is tagged with its type name, so 1 and
+    "1" do not collide, and a marker separates positional from keyword
+    arguments, so f("lang", "en") and f(lang="en") do not collide.
+    Keyword arguments are order-insensitive.
+    """
+    hasher = _new_hasher()
+    hasher.update(func_name.encode())
+    parts = chain(args, (_KWARGS_MARKER,), chain.from_iterable(sorted(kwargs.items())))
+    for part in parts:
+        if part is _KWARGS_MARKER:
+            hasher.update(b"\x01kw")
+            continue
+        hasher.update(b"\x00" + type(part).__name__.encode() + b"\x00")
+        if isinstance(part, (bytes, bytearray, memoryview)):
+            hasher.update(part)
+        elif isinstance(part, str):
+            hasher.update(part.encode())
+        else:
+            hasher.update(repr(part).encode())
+    return hasher.hexdigest()
+
+
+# In-memory tiers by (resolved cache_dir, backend, file extension), each an
+# LRU of hashed key -> (raw bytes, mtime) with its lock
+_mem_tiers: "Dict[Tuple[str, str, str], Tuple[OrderedDict, threading.Lock]]" = {}
+_mem_tiers_lock = threading.Lock()
+
+
+def _shared_mem_tier(store: Tuple[str, str, str]) -> Tuple[OrderedDict, threading.Lock]:
+    """Return the in-memory tier for a store, creating it on first use"""
+    with _mem_tiers_lock:
+        tier = _mem_tiers.get(store)
+        if tier is None:
+            tier = _mem_tiers[store] = (OrderedDict(), threading.Lock())
+        return tier
+
+
+# Writes queued by every cache with background_writes=True, as
+# (cache, hashed key, payload, mtime). One daemon thread drains the queue
+# for all instances, so per-session caches don't each start a thread, and a
+# single atexit hook flushes pending writes.
+_write_queue: "queue.Queue[Tuple[CacheManager, str, bytes, float]]" = queue.Queue(maxsize=1024)
+_writer_thread: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+
+
+def _write_worker() -> None:
+    """Drain the shared background write queue"""
+    while True:
+        cache, cache_key, data, mtime = _write_queue.get()
+        try:
+            cache._store_entry(cache_key, data, mtime, atomic=True)
+        except Exception as e:
+            logger.error(f"Error writing cache: {e}")
+        finally:
+            # Drop the reference so the cache can be collected once idle
+            del cache
+            _write_queue.task_done()
+
+
+def _start_writer() -> None:
+    """Start the shared writer thread on first use"""
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(target=_write_worker, name="cache-writer", daemon=True)
+            _writer_thread.start()
+            atexit.register(_write_queue.join)
+
+
+def _dumps_json(value: Any) -> bytes:
+    """Serialize a value to compact JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(value).encode('utf-8')
+
+
+def _loads_json(raw: bytes) -> Any:
+    """Parse JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class CacheManager:
     """
     Simple file-based cache for LLM responses.
 
+    Entries are stored one file per key by default. backend="sqlite" keeps
+    them in a single SQLite database in cache_dir instead, which avoids
+    per-entry files and directory scans for large caches.
+
     Usage:
         cache = CacheManager(cache_dir="./cache")
 
@@ -27,116 +155,345 @@ class CacheManager:
             cache.set(key, result)
     """
 
-    def __init__(self, cache_dir: str = "./cache", format: str = "json"):
+    def __init__(
+        self,
+        cache_dir: str = "./cache",
+        format: str = "json",
+        mem_cap: int = 512,
+        backend: str = "file",
+        background_writes: bool = False,
+        dtype: str = "float16"
+    ):
         """
         Args:
             cache_dir: Directory to store cache files
-            format: "json" or "pickle" - json is human-readable, pickle handles complex objects
+            format: "json" or "pickle" - json is human-readable, pickle handles complex objects;
+                "npy" stores numeric arrays (e.g. embeddings) as raw .npy data
+            mem_cap: Number of entries kept in the in-memory LRU tier (0 disables it)
+            backend: "file" (one file per entry) or "sqlite" (single database file)
+            background_writes: Persist set() calls on the shared background writer thread; values
+                are serialized immediately and readable from memory right away
+            dtype: Element type for format="npy" (float16 halves float32 size
+                at reduced precision; use "float32" for exact vectors)
+
+        Raises:
+            ValueError: If backend is not supported
         """
+        if backend not in ("file", "sqlite"):
+            raise ValueError(f"Unsupported cache backend: {backend}")
+
         self.cache_dir = Path(cache_dir)
         # Create directory and all parent directories if they don't exist
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.format = format
+        self._extension = {"json": "json", "npy": "npy"}.get(format, "pkl")
+        self.dtype = np.dtype(dtype)
+
+        # In-memory tier: hashed key -> (raw bytes, mtime). Raw bytes are kept
+        # rather than decoded values so callers can't mutate cached entries.
+        # The tier is shared by every instance on the same store, so a
+        # delete or clear_all() through one instance is seen by all of them.
+        self.mem_cap = mem_cap
+        self._mem, self._mem_lock = _shared_mem_tier(
+            (str(self.cache_dir.resolve()), backend, self._extension)
+        )
+
+        self.backend = backend
+        self._db = None
+        if backend == "sqlite":
+            self._db = self._open_db()
+
+        # Writes go through the module-level queue and writer thread
+        self.background_writes = background_writes
+        if background_writes:
+            _start_writer()
+
         logger.info(f"Cache initialized at {self.cache_dir}")
 
-    def _get_cache_key(self, key: str) -> str:
-        """Generate MD5 hash for cache key"""
-        if isinstance(key, str):
-            return hashlib.md5(key.encode()).hexdigest()
+    def _get_cache_key(self, key: CacheKey) -> str:
+        """Generate 128-bit hash for cache key (xxh3 if available, else MD5)"""
+        if isinstance(key, (bytes, bytearray, memoryview)):
+            # Pre-encoded keys (e.g. large prompts) are hashed without a copy
+            return _hexdigest(key)
+        elif isinstance(key, str):
+            return _hexdigest(key.encode())
         else:
             # Handle non-string keys
-            return hashlib.md5(str(key).encode()).hexdigest()
+            return _hexdigest(str(key).encode())
 
-    def _get_cache_path(self, key: str) -> Path:
+    def _get_cache_path(self, key: CacheKey) -> Path:
         """Get full path to cache file"""
-        cache_key = self._get_cache_key(key)
-        extension = "json" if self.format == "json" else "pkl"
-        return self.cache_dir / f"{cache_key}.{extension}"
+        return self._path_for_hash(self._get_cache_key(key))
+
+    def _path_for_hash(self, cache_key: str) -> Path:
+        """Get full path to cache file from an already hashed key"""
+        return self.cache_dir / f"{cache_key}.{self._extension}"
+
+    def _open_db(self) -> sqlite3.Connection:
+        """Open (and create if needed) the SQLite store for this cache"""
+        db_path = self.cache_dir / f"cache_{self._extension}.sqlite3"
+        # Shared across threads (e.g. background cache writers); access is
+        # serialized by _db_lock
+        db = sqlite3.connect(str(db_path), isolation_level=None, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS entries "
+            "(key TEXT PRIMARY KEY, value BLOB NOT NULL, mtime REAL NOT NULL) WITHOUT ROWID"
+        )
+        self._db_lock = threading.Lock()
+        return db
+
+    def _store_entry(self, cache_key: str, data: bytes, mtime: float, atomic: bool = False) -> None:
+        """Persist one entry to the backend"""
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, mtime) VALUES (?, ?, ?)",
+                    (cache_key, data, mtime)
+                )
+            return
+
+        cache_path = self._path_for_hash(cache_key)
+        if atomic:
+            # Write then rename, so concurrent readers never see a partial file
+            tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+        else:
+            with open(cache_path, 'wb') as f:
+                f.write(data)
+
+    def flush(self) -> None:
+        """Block until all queued background writes (of every cache) are on disk"""
+        _write_queue.join()
+
+    def _remember(self, cache_key: str, data: bytes, mtime: float) -> None:
+        """Insert an entry into the in-memory tier, evicting the oldest"""
+        if self.mem_cap <= 0:
+            return
+        with self._mem_lock:
+            self._mem[cache_key] = (data, mtime)
+            self._mem.move_to_end(cache_key)
+            while len(self._mem) > self.mem_cap:
+                self._mem.popitem(last=False)
+
+    def _is_expired(self, key: CacheKey, mtime: float, max_age_days: Optional[int]) -> bool:
+        """Check an entry's age against max_age_days"""
+        if max_age_days is None:
+            return False
+        # Plain float seconds; no datetime objects on the lookup path
+        age = time.time() - mtime
+        if age > max_age_days * 86400.0:
+            logger.debug("Cache expired: %.50s... (age: %d days)", key, age // 86400)
+            return True
+        return False
 
-    def get(self, key: str, max_age_days: Optional[int] = None) -> Optional[Any]:
+    def get(self, key: CacheKey, max_age_days: Optional[int] = None) -> Optional[Any]:
         """
         Retrieve cached value by key.
 
         Args:
-            key: Cache key (will be hashed)
+            key: Cache key, str or bytes (will be hashed)
             max_age_days: If set, only return cache if younger than this many days
 
         Returns:
             Cached value or None if not found/expired
         """
-        cache_path = self._get_cache_path(key)
+        raw = self.get_bytes(key, max_age_days=max_age_days)
+        if raw is None:
+            return None
+
+        try:
+            if self.format == "json":
+                return _loads_json(raw)
+            if self.format == "npy":
+                return np.load(io.BytesIO(raw), allow_pickle=False)
+            return pickle.loads(raw)
 
-        if not cache_path.exists():
-            logger.debug(f"Cache miss: {key[:50]}...")
+        except Exception as e:
+            logger.error(f"Error reading cache: {e}")
             return None
 
-        # Check age if specified
-        if max_age_days is not None:
-            file_age = datetime.now() - datetime.fromtimestamp(cache_path.stat().st_mtime)
-            if file_age > timedelta(days=max_age_days):
-                logger.info(f"Cache expired: {key[:50]}... (age: {file_age.days} days)")
+    def get_bytes(self, key: CacheKey, max_age_days: Optional[int] = None) -> Optional[bytes]:
+        """
+        Retrieve the raw cached file contents without decoding them.
+
+        Use this when the caller only forwards the payload (e.g. into another
+        prompt) or wants to parse it lazily. Recently used entries are served
+        from memory without touching the disk.
+
+        Args:
+            key: Cache key, str or bytes (will be hashed)
+            max_age_days: If set, only return cache if younger than this many days
+
+        Returns:
+            Cached bytes or None if not found/expired
+        """
+        cache_key = self._get_cache_key(key)
+
+        with self._mem_lock:
+            entry = self._mem.get(cache_key)
+            if entry is not None:
+                self._mem.move_to_end(cache_key)
+
+        if entry is not None:
+            data, mtime = entry
+            if self._is_expired(key, mtime, max_age_days):
+                return None
+            logger.debug("Cache hit (memory): %.50s...", key)
+            return data
+
+        if self._db is not None:
+            try:
+                with self._db_lock:
+                    row = self._db.execute(
+                        "SELECT value, mtime FROM entries WHERE key = ?", (cache_key,)
+                    ).fetchone()
+            except Exception as e:
+                logger.error(f"Error reading cache: {e}")
+                return None
+
+            if row is None:
+                logger.debug("Cache miss: %.50s...", key)
                 return None
 
+            data, mtime = row
+            if self._is_expired(key, mtime, max_age_days):
+                return None
+
+            self._remember(cache_key, data, mtime)
+            logger.debug("Cache hit: %.50s...", key)
+            return data
+
+        cache_path = self._path_for_hash(cache_key)
+
+        # One stat() both checks existence and gives the mtime
         try:
-            if self.format == "json":
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-            else:
-                with open(cache_path, 'rb') as f:
-                    data = pickle.load(f)
+            st = os.stat(cache_path)
+        except FileNotFoundError:
+            logger.debug("Cache miss: %.50s...", key)
+            return None
+
+        if self._is_expired(key, st.st_mtime, max_age_days):
+            return None
 
-            logger.debug(f"Cache hit: {key[:50]}...")
+        try:
+            with open(cache_path, 'rb') as f:
+                data = f.read()
+
+            self._remember(cache_key, data, st.st_mtime)
+            logger.debug("Cache hit: %.50s...", key)
             return data
 
         except Exception as e:
             logger.error(f"Error reading cache: {e}")
             return None
 
-    def set(self, key: str, value: Any) -> bool:
+    def set(self, key: CacheKey, value: Any) -> bool:
         """
         Store value in cache.
 
         Args:
-            key: Cache key (will be hashed)
-            value: Value to cache (must be JSON-serializable if format=json)
+            key: Cache key, str or bytes (will be hashed)
+            value: Value to cache (must be JSON-serializable if format=json,
+                array-like of numbers if format=npy)
 
         Returns:
             True if successful, False otherwise
         """
-        cache_path = self._get_cache_path(key)
-
         try:
             if self.format == "json":
-                with open(cache_path, 'w', encoding='utf-8') as f:
-                    json.dump(value, f, indent=2)
+                payload = _dumps_json(value)
+            elif self.format == "npy":
+                # .npy header (dtype + shape) followed by the raw array buffer
+                buffer = io.BytesIO()
+                np.save(buffer, np.asarray(value, dtype=self.dtype), allow_pickle=False)
+                payload = buffer.getvalue()
             else:
-                with open(cache_path, 'wb') as f:
-                    pickle.dump(value, f)
+                payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+        except Exception as e:
+            logger.error(f"Error writing cache: {e}")
+            return False
+
+        return self.set_bytes(key, payload)
+
+    def set_bytes(self, key: CacheKey, data: bytes) -> bool:
+        """
+        Store already-serialized bytes in cache as-is.
+
+        The bytes should be in the cache's format if they will later be read
+        with get(); callers that only use get_bytes() may store anything.
+
+        Args:
+            key: Cache key, str or bytes (will be hashed)
+            data: Raw payload to write
 
-            logger.debug(f"Cached: {key[:50]}...")
+        Returns:
+            True if successful, False otherwise
+        """
+        cache_key = self._get_cache_key(key)
+        data = bytes(data)
+        mtime = time.time()
+
+        if self.background_writes:
+            self._remember(cache_key, data, mtime)
+            _write_queue.put((self, cache_key, data, mtime))
+            logger.debug("Queued for caching: %.50s...", key)
+            return True
+
+        try:
+            self._store_entry(cache_key, data, mtime)
+            self._remember(cache_key, data, mtime)
+            logger.debug("Cached: %.50s...", key)
             return True
 
         except Exception as e:
             logger.error(f"Error writing cache: {e}")
             return False
 
-    def delete(self, key: str) -> bool:
+    def delete(self, key: CacheKey) -> bool:
         """Delete cached value by key"""
-        cache_path = self._get_cache_path(key)
+        self.flush()
+        cache_key = self._get_cache_key(key)
 
-        if cache_path.exists():
-            cache_path.unlink()
-            logger.debug(f"Cache deleted: {key[:50]}...")
-            return True
-        return False
+        with self._mem_lock:
+            self._mem.pop(cache_key, None)
+
+        if self._db is not None:
+            with self._db_lock:
+                deleted = self._db.execute("DELETE FROM entries WHERE key = ?", (cache_key,)).rowcount
+            if not deleted:
+                return False
+        else:
+            try:
+                os.unlink(self._path_for_hash(cache_key))
+            except FileNotFoundError:
+                return False
+
+        logger.debug("Cache deleted: %.50s...", key)
+        return True
 
     def clear_all(self) -> int:
         """
         Clear all cached files.
 
         Returns:
-            Number of files deleted
+            Number of files (or database entries) deleted
         """
+        self.flush()
+
+        with self._mem_lock:
+            self._mem.clear()
+
+        if self._db is not None:
+            with self._db_lock:
+                count = self._db.execute("DELETE FROM entries").rowcount
+            logger.info(f"Cleared {count} cache entries")
+            return count
+
         count = 0
         for cache_file in self.cache_dir.glob("*"):
             if cache_file.is_file():
@@ -148,6 +505,19 @@ class CacheManager:
 
     def get_stats(self) -> dict:
         """Get cache statistics"""
+        self.flush()
+
+        if self._db is not None:
+            with self._db_lock:
+                count, total_size = self._db.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(LENGTH(value)), 0) FROM entries"
+                ).fetchone()
+            return {
+                "total_files": count,
+                "total_size_mb": round(total_size / (1024 * 1024), 2),
+                "cache_dir": str(self.cache_dir)
+            }
+
         cache_files = list(self.cache_dir.glob("*"))
         total_size = sum(f.stat().st_size for f in cache_files if f.is_file())
 
@@ -157,7 +527,7 @@ class CacheManager:
             "cache_dir": str(self.cache_dir)
         }
 
-    def cached(self, ttl_days: int = 30):
+    def cached(self, ttl_days: int = 30, raw: bool = False):
         """
         Decorator to automatically cache function results.
 
@@ -168,24 +538,34 @@ class CacheManager:
             def expensive_function(text):
                 return process(text)
 
+        With raw=True the wrapped function must return bytes (e.g. the
+        serialized LLM response); they are stored and returned untouched, so a
+        cache hit skips decoding entirely and the caller parses lazily. This
+        trades the format-agnostic get()/set() round trip for speed.
+
         Args:
             ttl_days: Time-to-live in days
+            raw: Cache and return the function's bytes without (de)serializing
         """
+        read = self.get_bytes if raw else self.get
+        write = self.set_bytes if raw else self.set
+
         def decorator(func: Callable) -> Callable:
             def wrapper(*args, **kwargs):
-                # Create cache key from function name and arguments
-                cache_key = f"{func.__name__}_{str(args)}_{str(kwargs)}"
+                # Hash function name and arguments once; reused for both the
+                # lookup and the store
+                cache_key = _make_call_key(func.__name__, args, kwargs)
 
                 # Try to get from cache
-                cached_result = self.get(cache_key, max_age_days=ttl_days)
+                cached_result = read(cache_key, max_age_days=ttl_days)
                 if cached_result is not None:
-                    logger.info(f"✅ Cache hit for {func.__name__}")
+                    logger.info("✅ Cache hit for %s", func.__name__)
                     return cached_result
 
                 # Call function and cache result
-                logger.info(f"❌ Cache miss for {func.__name__}, calling function...")
+                logger.info("❌ Cache miss for %s, calling function...", func.__name__)
                 result = func(*args, **kwargs)
-                self.set(cache_key, result)
+                write(cache_key, result)
 
                 return result
 
@@ -194,11 +574,31 @@ class CacheManager:
 
 
 # Convenience functions for common use cases
-def create_text_cache(cache_dir: str = "./cache/llm_responses") -> CacheManager:
+def create_text_cache(
+    cache_dir: str = "./cache/llm_responses",
+    backend: str = "file",
+    background_writes: bool = False,
+    mem_cap: int = 512
+) -> CacheManager:
     """Create cache manager optimized for text/JSON responses"""
-    return CacheManager(cache_dir=cache_dir, format="json")
+    return CacheManager(
+        cache_dir=cache_dir,
+        format="json",
+        mem_cap=mem_cap,
+        backend=backend,
+        background_writes=background_writes
+    )
+
+
+def create_embedding_cache(
+    cache_dir: str = "./cache/embeddings",
+    dtype: str = "float16",
+    backend: str = "file"
+) -> CacheManager:
+    """Create cache manager for embedding vectors stored as raw arrays"""
+    return CacheManager(cache_dir=cache_dir, format="npy", dtype=dtype, backend=backend)
 
 
-def create_object_cache(cache_dir: str = "./cache/objects") -> CacheManager:
+def create_object_cache(cache_dir: str = "./cache/objects", backend: str = "file") -> CacheManager:
     """Create cache manager for Python objects using pickle"""
-    return CacheManager(cache_dir=cache_dir, format="pickle")
+    return CacheManager(cache_dir=cache_dir, format="pickle", backend=backend)
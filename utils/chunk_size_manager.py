@@ -5,7 +5,28 @@ Ensures chunks are optimally sized for embedding models and vector search.
 """
 
 import re
-from typing import List, Dict
+from collections import Counter
+from functools import lru_cache
+from typing import List, Dict, Optional
+
+import numpy as np
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Sentence boundary: whitespace following ., ! or ?
+_SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Clause separators used to split overlong sentences
+_CLAUSE_RE = re.compile(r'[,;]')
+
+
+@lru_cache(maxsize=4096)
+def _count_tokens(text: str) -> int:
+    """Word count of text, memoized since the same chunk is measured repeatedly"""
+    return len(text.split())
+
 
 class ChunkSizeManager:
     """
@@ -36,14 +57,14 @@ class ChunkSizeManager:
         For accurate counting, use: tiktoken library
         For this use case, word count is sufficient.
         """
-        return len(text.split())
+        return _count_tokens(text)
 
     @staticmethod
     def split_into_sentences(text: str) -> List[str]:
         """Split text into sentences while preserving meaning"""
-        # Use regex to split on sentence boundaries
-        sentences = re.split(r'(?<=[.!?])\s+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        # Use regex to split on sentence boundaries, stripping each piece once
+        stripped = (s.strip() for s in _SENTENCE_BOUNDARY_RE.split(text))
+        return [s for s in stripped if s]
 
     @classmethod
     def validate_chunk_size(cls, text: str) -> Dict[str, any]:
@@ -93,31 +114,98 @@ class ChunkSizeManager:
     def split_oversized_chunk(
         cls,
         chunk_data: Dict,
-        preserve_metadata: bool = True
+        preserve_metadata: bool = True,
+        tokens: Optional[int] = None
     ) -> List[Dict]:
         """
         Split a chunk that's too large into smaller, optimal chunks.
 
         Strategy:
-        1. Split by sentences (maintains semantic coherence)
-        2. Group sentences to reach IDEAL_TOKENS
+        1. Up to 2 * MAX_TOKENS: halve at the first sentence boundary past the
+           midpoint, if both halves fit within MAX_TOKENS
+        2. Otherwise split by sentences (maintains semantic coherence)
+           and group sentences to reach IDEAL_TOKENS
         3. Preserve metadata across all sub-chunks
 
         Args:
             chunk_data: Original chunk dict with 'content', 'chunk_id', 'field', 'metadata'
             preserve_metadata: Whether to copy metadata to sub-chunks
+            tokens: Token count of the content, if already known
 
         Returns:
             List of optimally-sized chunks
         """
         text = chunk_data['content']
-        tokens = cls.estimate_tokens(text)
+        if tokens is None:
+            tokens = cls.estimate_tokens(text)
 
         # If already optimal, return as-is
         if tokens <= cls.MAX_TOKENS:
             return [chunk_data]
 
-        # Split into sentences
+        # Mildly oversized chunks are halved at a sentence boundary; larger
+        # ones (or ones without a usable boundary) are grouped sentence by sentence
+        sub_chunks = None
+        if tokens <= 2 * cls.MAX_TOKENS:
+            sub_chunks = cls._split_in_half(text)
+        if sub_chunks is None:
+            sub_chunks = cls._group_sentences(text)
+
+        # Create chunk dicts with metadata
+        result_chunks = []
+        original_id = chunk_data['chunk_id']
+
+        # Only part_number differs between parts, so merge the metadata once
+        # and give each part a shallow copy
+        if preserve_metadata:
+            base_metadata = {
+                **chunk_data['metadata'],
+                'is_split': True,
+                'original_chunk_id': original_id,
+                'part_number': 0,
+                'total_parts': len(sub_chunks)
+            }
+        else:
+            base_metadata = chunk_data['metadata']
+
+        for i, sub_text in enumerate(sub_chunks):
+            metadata = base_metadata.copy()
+            if preserve_metadata:
+                metadata['part_number'] = i
+            new_chunk = {
+                'chunk_id': f"{original_id}_part{i}",
+                'field': chunk_data['field'],
+                'content': sub_text,
+                'metadata': metadata
+            }
+            result_chunks.append(new_chunk)
+
+        return result_chunks
+
+    @classmethod
+    def _split_in_half(cls, text: str) -> Optional[List[str]]:
+        """
+        Split text in two at the first sentence boundary past its midpoint.
+
+        Returns:
+            The two halves, or None if there is no boundary or a half would
+            still exceed MAX_TOKENS
+        """
+        boundary = _SENTENCE_BOUNDARY_RE.search(text, len(text) // 2)
+        if boundary is None:
+            return None
+
+        first = text[:boundary.start()].strip()
+        second = text[boundary.end():].strip()
+        if not first or not second:
+            return None
+        if cls.estimate_tokens(first) > cls.MAX_TOKENS or cls.estimate_tokens(second) > cls.MAX_TOKENS:
+            return None
+        return [first, second]
+
+    @classmethod
+    def _group_sentences(cls, text: str) -> List[str]:
+        """Group sentences (or clauses of overlong sentences) into IDEAL_TOKENS-sized texts"""
         sentences = cls.split_into_sentences(text)
 
         # Group sentences into optimal chunks
@@ -137,7 +225,7 @@ class ChunkSizeManager:
                     current_tokens = 0
 
                 # Split long sentence by commas or semicolons
-                parts = re.split(r'[,;]', sentence)
+                parts = _CLAUSE_RE.split(sentence)
                 for part in parts:
                     part = part.strip()
                     part_tokens = cls.estimate_tokens(part)
@@ -165,26 +253,7 @@ class ChunkSizeManager:
         if current_chunk:
             sub_chunks.append(" ".join(current_chunk))
 
-        # Create chunk dicts with metadata
-        result_chunks = []
-        original_id = chunk_data['chunk_id']
-
-        for i, sub_text in enumerate(sub_chunks):
-            new_chunk = {
-                'chunk_id': f"{original_id}_part{i}",
-                'field': chunk_data['field'],
-                'content': sub_text,
-                'metadata': {
-                    **chunk_data['metadata'],
-                    'is_split': True,
-                    'original_chunk_id': original_id,
-                    'part_number': i,
-                    'total_parts': len(sub_chunks)
-                } if preserve_metadata else chunk_data['metadata'].copy()
-            }
-            result_chunks.append(new_chunk)
-
-        return result_chunks
+        return sub_chunks
 
     @classmethod
     def process_chunks(cls, chunks: List[Dict]) -> List[Dict]:
@@ -198,25 +267,32 @@ class ChunkSizeManager:
             List of optimally-sized chunks (may be larger than input)
         """
         processed_chunks = []
+        status_counts = Counter()
+        split_parts = 0
 
         for chunk in chunks:
             validation = cls.validate_chunk_size(chunk['content'])
+            status_counts[validation['status']] += 1
 
             if validation['status'] == 'TOO_LARGE':
                 # Split oversized chunk
-                sub_chunks = cls.split_oversized_chunk(chunk)
+                sub_chunks = cls.split_oversized_chunk(chunk, tokens=validation['tokens'])
                 processed_chunks.extend(sub_chunks)
-                print(f"⚠️ Split large chunk '{chunk['chunk_id']}' "
-                      f"({validation['tokens']} tokens) into {len(sub_chunks)} parts")
+                split_parts += len(sub_chunks)
+                logger.debug(
+                    "Split large chunk '%s' (%d tokens) into %d parts",
+                    chunk['chunk_id'], validation['tokens'], len(sub_chunks)
+                )
             else:
                 # Keep as-is
                 processed_chunks.append(chunk)
-                if validation['status'] == 'OPTIMAL':
-                    print(f"✅ Chunk '{chunk['chunk_id']}' size optimal ({validation['tokens']} tokens)")
-                elif validation['status'] == 'LARGE':
-                    print(f"⚠️ Chunk '{chunk['chunk_id']}' is large ({validation['tokens']} tokens) but acceptable")
-                else:  # TOO_SMALL
-                    print(f"ℹ️ Chunk '{chunk['chunk_id']}' is small ({validation['tokens']} tokens)")
+
+        # One summary line per batch instead of a line per chunk
+        logger.info(
+            "Processed %d chunks into %d (%d split into %d parts): %s",
+            len(chunks), len(processed_chunks), status_counts['TOO_LARGE'], split_parts,
+            dict(status_counts)
+        )
 
         return processed_chunks
 
@@ -234,17 +310,24 @@ class ChunkSizeManager:
                 'optimal_count': 0
             }
 
-        token_counts = [cls.estimate_tokens(c['content']) for c in chunks]
+        # Collect counts once, then aggregate with vectorized reductions
+        token_counts = np.fromiter(
+            (cls.estimate_tokens(c['content']) for c in chunks),
+            dtype=np.int64,
+            count=len(chunks)
+        )
 
-        oversized = sum(1 for t in token_counts if t > cls.MAX_TOKENS)
-        undersized = sum(1 for t in token_counts if t < cls.MIN_TOKENS)
-        optimal = sum(1 for t in token_counts if cls.MIN_TOKENS <= t <= cls.IDEAL_TOKENS)
+        oversized = int(np.count_nonzero(token_counts > cls.MAX_TOKENS))
+        undersized = int(np.count_nonzero(token_counts < cls.MIN_TOKENS))
+        optimal = int(np.count_nonzero(
+            (token_counts >= cls.MIN_TOKENS) & (token_counts <= cls.IDEAL_TOKENS)
+        ))
 
         return {
             'total_chunks': len(chunks),
-            'avg_tokens': sum(token_counts) // len(token_counts),
-            'min_tokens': min(token_counts),
-            'max_tokens': max(token_counts),
+            'avg_tokens': int(token_counts.sum()) // len(chunks),
+            'min_tokens': int(token_counts.min()),
+            'max_tokens': int(token_counts.max()),
             'oversized_count': oversized,
             'undersized_count': undersized,
             'optimal_count': optimal,
@@ -0,0 +1,77 @@
+"""
+Shared LLM Client Factory
+
+Reuses Gemini model clients across processor and matcher instances so the
+underlying connection is set up once per process instead of per instance,
+and runs async LLM code from synchronous callers on one shared event loop.
+"""
+
+import asyncio
+import threading
+from functools import lru_cache
+from typing import Any, Awaitable, Optional
+
+import google.generativeai as genai
+
+# Event loop shared by all synchronous callers of async LLM code; see run_async
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def get_generative_model(api_key: str, model_name: str) -> genai.GenerativeModel:
+    """
+    Get a cached Gemini model client for an API key and model name.
+
+    The first call for a given key configures the genai SDK; later calls
+    (e.g. a new matcher per request) return the same client, which keeps
+    its already-established connection.
+
+    Args:
+        api_key: Google API key
+        model_name: Gemini model name
+
+    Returns:
+        Shared GenerativeModel instance
+    """
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Start the shared event loop in a daemon thread on first use"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="llm-event-loop", daemon=True).start()
+            _loop = loop
+    return _loop
+
+
+def run_async(coro: Awaitable[Any]) -> Any:
+    """
+    Run a coroutine from synchronous code and return its result.
+
+    The cached Gemini clients keep an async gRPC channel that is bound to the
+    event loop it was first used on, so asyncio.run() (a new loop per call)
+    fails with "Event loop is closed" from the second call on. Coroutines
+    are instead run on one persistent loop in a background thread.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result (its exception is re-raised)
+
+    Raises:
+        RuntimeError: If called from the shared loop itself (it would deadlock)
+    """
+    loop = _get_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        raise RuntimeError("run_async() cannot be called from the shared LLM event loop")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
@@ -4,12 +4,24 @@ Provides structured logging with different levels and formatters
 """
 
 import logging
+import os
+import re
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 import json
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# %(levelname) placeholder in %-style formats; any flags/width after it are kept
+_LEVELNAME_RE = re.compile(r'%\(levelname\)')
+
 
 class JSONFormatter(logging.Formatter):
     """
@@ -17,9 +29,25 @@ class JSONFormatter(logging.Formatter):
     Outputs logs in JSON format for easier parsing and analysis
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, UTC "YYYY-MM-DDTHH:MM:SS" prefix) for the last second seen.
+        # Kept as one tuple so handlers on other threads never pair a second
+        # with another second's prefix
+        self._cached_second_prefix = (None, '')
+
+    def _timestamp(self, created: float) -> str:
+        """ISO-8601 UTC timestamp of the record, reformatting the date part once per second"""
+        second = int(created)
+        cached_second, prefix = self._cached_second_prefix
+        if second != cached_second:
+            prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+            self._cached_second_prefix = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1e6):06d}"
+
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': self._timestamp(record.created),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -36,6 +64,8 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, 'extra_data'):
             log_data['extra'] = record.extra_data
 
+        if orjson is not None:
+            return orjson.dumps(log_data).decode()
         return json.dumps(log_data)
 
 
@@ -54,19 +84,36 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'        # Reset
     }
 
+    def __init__(self, fmt: Optional[str] = None, *args, **kwargs):
+        # For %-style formats, read the colored level from its own record
+        # attribute so the record's levelname never has to be swapped and
+        # restored. Other styles fall back to swapping it during format()
+        style = kwargs.get('style', args[1] if len(args) > 1 else '%')
+        self._swap_levelname = True
+        if fmt is not None and style == '%' and _LEVELNAME_RE.search(fmt):
+            fmt = _LEVELNAME_RE.sub('%(colored_levelname)', fmt)
+            self._swap_levelname = False
+        super().__init__(fmt, *args, **kwargs)
+
+        # Colored level names, built once instead of per record
+        reset = self.COLORS['RESET']
+        self._colored_levels = {
+            level: f"{color}{level}{reset}"
+            for level, color in self.COLORS.items() if level != 'RESET'
+        }
+
     def format(self, record: logging.LogRecord) -> str:
-        # Add color to level name
         levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[levelname]}{levelname}{self.COLORS['RESET']}"
-
-        # Format the message
-        formatted = super().format(record)
+        colored_levelname = self._colored_levels.get(levelname, levelname)
+        if not self._swap_levelname:
+            record.colored_levelname = colored_levelname
+            return super().format(record)
 
-        # Reset levelname for future uses
-        record.levelname = levelname
-
-        return formatted
+        record.levelname = colored_levelname
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 def setup_logger(
@@ -95,11 +142,12 @@ def setup_logger(
     if logger.handlers:
         return logger
 
-    logger.setLevel(getattr(logging, log_level.upper()))
+    level = getattr(logging, log_level.upper())
+    logger.setLevel(level)
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, log_level.upper()))
+    console_handler.setLevel(level)
 
     if use_colors:
         console_format = ColoredFormatter(
@@ -119,17 +167,18 @@ def setup_logger(
     if log_dir:
         log_path = Path(log_dir)
         log_path.mkdir(parents=True, exist_ok=True)
+        date_tag = datetime.now().strftime('%Y%m%d')
 
         # Create separate log files for different levels
         # Main log file
         file_handler = logging.FileHandler(
-            log_path / f"career_copilot_{datetime.now().strftime('%Y%m%d')}.log"
+            log_path / f"career_copilot_{date_tag}.log"
         )
         file_handler.setLevel(logging.DEBUG)
 
         # Error log file
         error_handler = logging.FileHandler(
-            log_path / f"errors_{datetime.now().strftime('%Y%m%d')}.log"
+            log_path / f"errors_{date_tag}.log"
         )
         error_handler.setLevel(logging.ERROR)
 
@@ -151,10 +200,14 @@ def setup_logger(
     return logger
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
     Get or create a logger with default configuration
 
+    Loggers are cached by name, so the environment is only read the first
+    time a name is requested.
+
     Args:
         name: Logger name (typically __name__)
 
@@ -166,7 +219,6 @@ def get_logger(name: str) -> logging.Logger:
 
     if not logger.handlers:
         # Set up with default configuration
-        import os
         log_level = os.getenv('LOG_LEVEL', 'INFO')
         log_dir = os.getenv('LOG_DIR', './logs')
         use_json = os.getenv('LOG_FORMAT', 'text').lower() == 'json'
@@ -208,30 +260,56 @@ def log_execution_time(logger: logging.Logger):
             pass
     """
     import functools
-    import time
+    import inspect
+
+    def log_completed(func_name: str, start_ns: int):
+        # Skip building the message and extra dict when INFO is disabled
+        if logger.isEnabledFor(logging.INFO):
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+            logger.info(
+                "%s completed in %.2fs", func_name, execution_time,
+                extra={'execution_time': execution_time, 'function': func_name}
+            )
+
+    def log_failed(func_name: str, start_ns: int, error: Exception):
+        execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+        logger.error(
+            "%s failed after %.2fs: %s", func_name, execution_time, error,
+            extra={'execution_time': execution_time, 'function': func_name},
+            exc_info=True
+        )
 
     def decorator(func):
+        func_name = func.__name__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start_ns = time.perf_counter_ns()
+                logger.debug("Starting %s", func_name)
+
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as e:
+                    log_failed(func_name, start_ns, e)
+                    raise
+                log_completed(func_name, start_ns)
+                return result
+
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
-            logger.debug(f"Starting {func.__name__}")
+            start_ns = time.perf_counter_ns()
+            logger.debug("Starting %s", func_name)
 
             try:
                 result = func(*args, **kwargs)
-                execution_time = time.time() - start_time
-                logger.info(
-                    f"{func.__name__} completed in {execution_time:.2f}s",
-                    extra={'execution_time': execution_time, 'function': func.__name__}
-                )
-                return result
             except Exception as e:
-                execution_time = time.time() - start_time
-                logger.error(
-                    f"{func.__name__} failed after {execution_time:.2f}s: {str(e)}",
-                    extra={'execution_time': execution_time, 'function': func.__name__},
-                    exc_info=True
-                )
+                log_failed(func_name, start_ns, e)
                 raise
+            log_completed(func_name, start_ns)
+            return result
 
         return wrapper
     return decorator
@@ -4,8 +4,46 @@ Text Processing Utilities
 Shared text processing functions used across the application.
 """
 
+import json
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    _json_loads = json.loads
+
+# Patterns used by normalize_text
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_URL_RE = re.compile(r'http[s]?://\S+')
+
+# Characters removed by clean_name_for_id: anything but word characters,
+# whitespace and hyphens. ASCII names use a translate table (one C pass).
+_NAME_STRIP_RE = re.compile(r'[^\w\s-]')
+_NAME_ASCII_STRIP_TABLE = str.maketrans('', '', ''.join(
+    ch for ch in map(chr, range(128))
+    if not (ch.isalnum() or ch in '_-' or ch.isspace())
+))
+
+# Characters that affect brace matching in JSON (single class, never backtracks)
+_JSON_TOKEN_RE = re.compile(r'["{}\\]')
+
+
+def _strip_tags(text: str) -> str:
+    """
+    Remove HTML tags, matching _HTML_TAG_RE.sub('', text) exactly.
+
+    A tag must end in '>', so nothing after the last '>' can be part of one.
+    Bounding the regex to that prefix stops it from rescanning to the end of
+    the text for every stray '<' (e.g. "a < b" in plain-text resumes), which
+    is quadratic on long inputs.
+    """
+    last = text.rfind('>')
+    if last == -1:
+        return text
+    return _HTML_TAG_RE.sub('', text[:last + 1]) + text[last + 1:]
 
 
 def normalize_text(text: str) -> str:
@@ -27,24 +65,27 @@ def normalize_text(text: str) -> str:
     if not text:
         return ""
 
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
+    # Remove HTML tags (skip the regex when there can be none)
+    if '<' in text:
+        text = _strip_tags(text)
 
     # Replace URLs with placeholder
-    text = re.sub(r'http[s]?://\S+', '[URL]', text)
-
-    # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text)
+    if 'http' in text:
+        text = _URL_RE.sub('[URL]', text)
 
-    return text.strip()
+    # Normalize whitespace: str.split() uses the same whitespace set as \s,
+    # so this collapses runs and strips the ends in one C-level pass
+    return ' '.join(text.split())
 
 
+@lru_cache(maxsize=4096)
 def clean_name_for_id(name: str) -> Optional[str]:
     """
     Clean a person's name to create a valid ID.
 
     Removes special characters, converts to lowercase, and replaces
-    spaces with underscores.
+    spaces with underscores. Results are memoized, since the same names
+    recur across uploads and reruns.
 
     Args:
         name: Person's name
@@ -64,10 +105,14 @@ def clean_name_for_id(name: str) -> Optional[str]:
         return None
 
     # Remove special characters except spaces and hyphens
-    clean_name = re.sub(r'[^\w\s-]', '', name)
+    if name.isascii():
+        clean_name = name.translate(_NAME_ASCII_STRIP_TABLE)
+    else:
+        clean_name = _NAME_STRIP_RE.sub('', name)
 
-    # Replace spaces with underscores
-    clean_name = re.sub(r'\s+', '_', clean_name.strip())
+    # Replace whitespace runs with underscores (str.split() splits on exactly
+    # the characters \s matches and drops leading/trailing runs)
+    clean_name = '_'.join(clean_name.split())
 
     # Convert to lowercase
     clean_name = clean_name.lower()
@@ -121,16 +166,84 @@ def extract_json_from_text(text: str) -> Optional[str]:
         >>> extract_json_from_text('Some text {"key": "value"} more text')
         '{"key": "value"}'
     """
+    # Markdown code fences need no stripping: they contain no braces, and the
+    # scan starts at the first '{' and ends at its matching '}'
+    return find_json_object(text)
+
+
+def find_json_object(text: str) -> Optional[str]:
+    """
+    Find the first balanced JSON object in text with a single linear scan.
+
+    Tracks brace depth while skipping braces inside string literals, so
+    there is no regex backtracking on long LLM responses. If the object is
+    never closed (e.g. a truncated response), falls back to the span from
+    the first '{' to the last '}'.
+
+    Args:
+        text: Text that may contain a JSON object
+
+    Returns:
+        JSON object substring, or None if no object found
+
+    Examples:
+        >>> find_json_object('Result: {"a": {"b": "}"}} trailing {x}')
+        '{"a": {"b": "}"}}'
+    """
     if not text:
         return None
 
-    # Remove markdown code blocks
-    text = re.sub(r'^```(?:json)?\s*', '', text.strip())
-    text = re.sub(r'\s*```$', '', text.strip())
+    start = text.find('{')
+    if start == -1:
+        return None
 
-    # Try to extract JSON object
-    match = re.search(r'\{.*\}', text, re.DOTALL)
-    return match.group() if match else None
+    depth = 0
+    in_string = False
+    skip_to = start
+    for match in _JSON_TOKEN_RE.finditer(text, start):
+        i = match.start()
+        if i < skip_to:
+            # Character escaped by a preceding backslash
+            continue
+
+        ch = match.group()
+        if in_string:
+            if ch == '\\':
+                skip_to = i + 2
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+
+    end = text.rfind('}')
+    return text[start:end + 1] if end > start else None
+
+
+def parse_json(json_str: str) -> Any:
+    """
+    Parse a JSON string, using orjson when it is installed.
+
+    Args:
+        json_str: JSON document
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        json.JSONDecodeError: If the string is not valid JSON
+            (orjson.JSONDecodeError is a subclass)
+
+    Examples:
+        >>> parse_json('{"key": [1, 2]}')
+        {'key': [1, 2]}
+    """
+    return _json_loads(json_str)
 
 
 def format_list_as_string(
@@ -164,6 +277,14 @@ def format_list_as_string(
         displayed_items = items[:max_items]
         overflow_count = len(items) - max_items
         suffix = overflow_suffix.format(count=overflow_count)
-        return separator.join(str(item) for item in displayed_items) + suffix
+        return _join_as_str(separator, displayed_items) + suffix
+
+    return _join_as_str(separator, items)
+
 
-    return separator.join(str(item) for item in items)
+def _join_as_str(separator: str, items) -> str:
+    """Join items as strings; lists that are already all str (the usual case) skip conversion"""
+    try:
+        return separator.join(items)
+    except TypeError:
+        return separator.join(str(item) for item in items)